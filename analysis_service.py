@@ -8,30 +8,28 @@ from datetime import date, datetime, timedelta
 from decimal import Decimal
 
 from ..models.expense_model import Expense
-from .database_service import DatabaseService
+from .database_service import DatabaseService, ExpenseRow
 
 class AnalysisService:
     """Service for expense analysis operations"""
 
     def __init__(self):
-        self.db_service = DatabaseService()
+        self.db_service = DatabaseService.get_default()
 
     def get_yearly_summary(self, year: int) -> Dict[str, Any]:
         """Get yearly expense summary"""
-        monthly_totals = []
-        for month in range(1, 13):
-            summary = self.db_service.get_monthly_summary(year, month)
-            if summary["total_expenses"] > 0:
-                monthly_totals.append(
-                    {
-                        "month": month,
-                        "year": year,
-                        "total": summary["total_expenses"],
-                        "transaction_count": len(
-                            self.db_service.get_expenses(month=month, year=year)
-                        ),
-                    }
-                )
+        # One grouped query for the whole year instead of one per month
+        yearly = self.db_service.get_yearly_summary(year)
+        monthly_totals = [
+            {
+                "month": int(item["month"]),
+                "year": year,
+                "total": item["total"],
+                "transaction_count": item["count"],
+            }
+            for item in yearly["monthly_breakdown"]
+            if item["total"] > 0
+        ]
         total_year = sum(item["total"] for item in monthly_totals)
         avg_monthly = total_year / len(monthly_totals) if monthly_totals else 0
         return {
@@ -76,23 +74,20 @@ class AnalysisService:
 
     def get_spending_patterns(self, start_date: date, end_date: date) -> Dict[str, Any]:
         """Analyze spending patterns between dates"""
-        expenses = self.db_service.get_expenses()
-        # Filter by date range
-        filtered_expenses = [
-            exp
-            for exp in expenses
-            if start_date <= datetime.strptime(exp["date"], "%Y-%m-%d").date() <= end_date
-        ]
+        # The date range is applied in SQL on the indexed date column
+        filtered_expenses = self.db_service.get_expenses_by_date_range(
+            start_date, end_date, as_rows=True
+        )
         if not filtered_expenses:
             return {"message": "No expenses in date range"}
         # Calculate statistics
-        amounts = [exp["amount"] for exp in filtered_expenses]
+        amounts = [exp.amount for exp in filtered_expenses]
         total = sum(amounts)
         average = total / len(amounts)
         # Find most common day of week
         weekdays = []
         for exp in filtered_expenses:
-            exp_date = datetime.strptime(exp["date"], "%Y-%m-%d").date()
+            exp_date = datetime.strptime(exp.date, "%Y-%m-%d").date()
             weekdays.append(exp_date.strftime("%A"))
         from collections import Counter
 
@@ -108,12 +103,12 @@ class AnalysisService:
             "category_distribution": self._get_category_distribution(filtered_expenses),
         }
 
-    def _get_category_distribution(self, expenses: List[Dict]) -> Dict[str, float]:
+    def _get_category_distribution(self, expenses: List[ExpenseRow]) -> Dict[str, float]:
         """Helper to get category distribution"""
         category_totals = {}
         for exp in expenses:
-            category = exp["category"]
-            amount = exp["amount"]
+            category = exp.category
+            amount = exp.amount
             category_totals[category] = category_totals.get(category, 0) + amount
         total = sum(category_totals.values())
         # Convert to percentages
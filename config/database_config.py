@@ -12,35 +12,68 @@ from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 
+from .schema import apply_schema
+
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 )
 logger = logging.getLogger(__name__)
 
+# Prepared statements kept per connection (sqlite3 defaults to 128)
+STATEMENT_CACHE_SIZE = 256
+
 class DatabaseConfig:
     def __init__(self, db_name: str = "expenses.db"):
         self.project_root = Path(__file__).parent.parent
         self.data_dir = self.project_root / "data"
         self.db_path = self.data_dir / db_name
         self.data_dir.mkdir(exist_ok=True)
+        # Opened on first use and reused by this object's own methods
+        self._connection = None
         logger.info(f"Database path: {self.db_path}")
 
     def get_connection(self) -> sqlite3.Connection:
         """Create and return a database connection"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = sqlite3.connect(self.db_path, cached_statements=STATEMENT_CACHE_SIZE)
             conn.row_factory = sqlite3.Row
             return conn
         except sqlite3.Error as e:
             logger.error(f"Database connection error: {e}")
             raise
 
+    def _shared_connection(self) -> sqlite3.Connection:
+        """Return the long-lived connection used by this object's methods"""
+        if self._connection is None:
+            self._connection = self.get_connection()
+            # Autocommit mode: transactions are opened by _write_transaction
+            self._connection.isolation_level = None
+        return self._connection
+
+    @contextmanager
+    def _write_transaction(self):
+        """Run writes inside BEGIN IMMEDIATE so the write lock is taken up front"""
+        conn = self._shared_connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.rollback()
+            raise
+        conn.commit()
+
+    def close(self):
+        """Close the long-lived connection, if it was opened"""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
     @contextmanager
     def get_connection_context(self):
         """Context manager version for use with 'with' statement"""
         conn = None
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = sqlite3.connect(self.db_path, cached_statements=STATEMENT_CACHE_SIZE)
             conn.row_factory = sqlite3.Row
             yield conn
         except sqlite3.Error as e:
@@ -53,72 +86,9 @@ class DatabaseConfig:
     def initialize_database(self) -> bool:
         """Initialize database with tables and indexes"""
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-            # Create expenses table
-            cursor.execute(
-                """
-                CREATE TABLE IF NOT EXISTS expenses (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    date DATE NOT NULL,
-                    category VARCHAR(50) NOT NULL,
-                    amount DECIMAL(10,2) NOT NULL CHECK (amount >= 0),
-                    description TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """
-            )
-            # Create categories table
-            cursor.execute(
-                """
-                CREATE TABLE IF NOT EXISTS categories (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name VARCHAR(50) UNIQUE NOT NULL,
-                    budget_limit DECIMAL(10,2) DEFAULT NULL CHECK (budget_limit >= 0),
-                    description TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """
-            )
-            # Create indexes for performance
-            cursor.execute(
-                """
-                CREATE INDEX IF NOT EXISTS idx_expenses_date
-                ON expenses(date)
-            """
-            )
-            cursor.execute(
-                """
-                CREATE INDEX IF NOT EXISTS idx_expenses_category
-                ON expenses(category)
-            """
-            )
-            cursor.execute(
-                """
-                CREATE INDEX IF NOT EXISTS idx_expenses_date_category
-                ON expenses(date, category)
-            """
-            )
-            # Insert default categories
-            default_categories = [
-                ("Makanan & Minuman", 0, "Pengeluaran untuk makanan dan minuman"),
-                ("Transportasi", 0, "Biaya transportasi"),
-                ("Belanja", 0, "Belanja kebutuhan sehari-hari"),
-                ("Hiburan", 0, "Pengeluaran hiburan dan rekreasi"),
-                ("Kesehatan", 0, "Biaya kesehatan dan obat-obatan"),
-                ("Pendidikan", 0, "Biaya pendidikan dan kursus"),
-                ("Tagihan", 0, "Pembayaran tagihan rutin"),
-                ("Lain-lain", 0, "Pengeluaran lainnya"),
-            ]
-            for category in default_categories:
-                cursor.execute(
-                    """INSERT OR IGNORE INTO categories (name, budget_limit, description)
-                       VALUES (?, ?, ?)""",
-                    category,
-                )
-            conn.commit()
-            conn.close()
+            # One transaction, so the DDL and seed rows land together
+            with self._write_transaction() as conn:
+                apply_schema(conn)
             logger.info("Database initialized successfully")
             return True
         except sqlite3.Error as e:
@@ -128,15 +98,14 @@ class DatabaseConfig:
     def optimize_database(self):
         """Optimize database performance"""
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-            # Create additional indexes if needed
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_expenses_amount ON expenses(amount)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_categories_name ON categories(name)")
-            # Analyze tables for query optimization
-            cursor.execute("ANALYZE")
-            conn.commit()
-            conn.close()
+            # The new indexes and fresh statistics commit together
+            with self._write_transaction() as conn:
+                cursor = conn.cursor()
+                # Create additional indexes if needed
+                cursor.execute("CREATE INDEX IF NOT EXISTS idx_expenses_amount ON expenses(amount)")
+                cursor.execute("CREATE INDEX IF NOT EXISTS idx_categories_name ON categories(name)")
+                # Analyze tables for query optimization
+                cursor.execute("ANALYZE")
             logger.info("Database optimized with indexes")
             return True
         except sqlite3.Error as e:
@@ -172,7 +141,7 @@ class DatabaseConfig:
         if self.db_path.exists():
             info["size_bytes"] = self.db_path.stat().st_size
             try:
-                conn = self.get_connection()
+                conn = self._shared_connection()
                 cursor = conn.cursor()
                 # Get tables
                 cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
@@ -189,7 +158,6 @@ class DatabaseConfig:
                     cursor.execute(f"SELECT COUNT(*) as count FROM {table}")
                     count = cursor.fetchone()["count"]
                     info[f"{table}_count"] = count
-                conn.close()
             except sqlite3.Error as e:
                 logger.error(f"Error getting database info: {e}")
         return info
@@ -224,6 +192,7 @@ def test_database():
         print("\nBackup created successfully")
     if db_config.optimize_database():
         print("Database optimized successfully")
+    db_config.close()
 
 if __name__ == "__main__":
     test_database()
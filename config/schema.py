@@ -0,0 +1,133 @@
+# config/schema.py
+
+"""
+Database Schema for daily-expense-tracker
+Table definitions, default categories, indexes and migrations shared by
+DatabaseConfig and DatabaseService
+"""
+
+import logging
+import re
+import sqlite3
+
+logger = logging.getLogger(__name__)
+
+# Stored in PRAGMA user_version once apply_schema has run; bump it
+# whenever apply_schema gains a new table, column, index or migration
+SCHEMA_VERSION = 1
+
+CREATE_EXPENSES_SQL = """
+    CREATE TABLE IF NOT EXISTS expenses (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        date DATE NOT NULL,
+        category VARCHAR(50) NOT NULL,
+        amount INTEGER NOT NULL CHECK (amount >= 0),
+        description TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        ym TEXT GENERATED ALWAYS AS (substr(date, 1, 7)) VIRTUAL
+    )
+"""
+CREATE_CATEGORIES_SQL = """
+    CREATE TABLE IF NOT EXISTS categories (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name VARCHAR(50) UNIQUE NOT NULL,
+        budget_limit DECIMAL(10,2) DEFAULT NULL CHECK (budget_limit >= 0),
+        description TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+"""
+
+# (name, budget_limit, description) rows seeded into a new database
+DEFAULT_CATEGORIES = [
+    ("Makanan & Minuman", None, "Pengeluaran untuk makanan dan minuman"),
+    ("Transportasi", None, "Pengeluaran untuk transportasi"),
+    ("Belanja", None, "Pengeluaran untuk belanja"),
+    ("Hiburan", None, "Pengeluaran untuk hiburan"),
+    ("Kesehatan", None, "Pengeluaran untuk kesehatan"),
+    ("Pendidikan", None, "Pengeluaran untuk pendidikan"),
+    ("Tagihan", None, "Pengeluaran untuk tagihan"),
+    ("Lain-lain", None, "Pengeluaran lainnya"),
+]
+
+# Run in order after the tables exist
+INDEX_SQL = (
+    "CREATE INDEX IF NOT EXISTS idx_expenses_date ON expenses(date)",
+    # Serves category filters alone and category + month ranges, already in
+    # display order; it supersedes the old category and (category, date) indexes
+    "CREATE INDEX IF NOT EXISTS idx_expenses_category_date_created "
+    "ON expenses(category, date DESC, created_at DESC)",
+    "DROP INDEX IF EXISTS idx_expenses_category",
+    "DROP INDEX IF EXISTS idx_expenses_category_date",
+    "CREATE INDEX IF NOT EXISTS idx_expenses_date_category ON expenses(date, category)",
+    # Monthly summaries filter on ym and group by category
+    "CREATE INDEX IF NOT EXISTS idx_expenses_ym_category ON expenses(ym, category)",
+    # Lets history queries read rows in display order without a sort step
+    "CREATE INDEX IF NOT EXISTS idx_expenses_date_created_desc "
+    "ON expenses(date DESC, created_at DESC)",
+)
+
+# The declared type of the amount column in a CREATE TABLE statement, e.g. "DECIMAL(10,2)"
+_AMOUNT_TYPE_RE = re.compile(r"(\bamount\s+)[A-Za-z]+(\s*\([\d\s,]*\))?", re.IGNORECASE)
+
+# "YYYY-MM" of each expense, computed by SQLite so month grouping can use an index
+_ADD_YM_COLUMN_SQL = (
+    "ALTER TABLE expenses ADD COLUMN "
+    "ym TEXT GENERATED ALWAYS AS (substr(date, 1, 7)) VIRTUAL"
+)
+
+
+def apply_schema(conn: sqlite3.Connection):
+    """Create or upgrade the tables, seed categories and indexes; run inside a transaction"""
+    # Create expenses table, upgrading old DECIMAL amounts to cents
+    _migrate_amounts_to_cents(conn)
+    conn.execute(CREATE_EXPENSES_SQL)
+    _add_month_column(conn)
+
+    # Create categories table
+    conn.execute(CREATE_CATEGORIES_SQL)
+    conn.executemany(
+        "INSERT OR IGNORE INTO categories (name, budget_limit, description) VALUES (?, ?, ?)",
+        DEFAULT_CATEGORIES,
+    )
+
+    for sql in INDEX_SQL:
+        conn.execute(sql)
+    conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+
+def _migrate_amounts_to_cents(conn: sqlite3.Connection):
+    """Rebuild an expenses table that still stores amount as DECIMAL/REAL"""
+    # (cid, name, type, ...) rows; indexed so any row factory works
+    columns = conn.execute("PRAGMA table_info(expenses)").fetchall()
+    amount_type = next((column[2] for column in columns if column[1] == "amount"), None)
+    if amount_type is None or amount_type.upper() == "INTEGER":
+        return
+
+    logger.info("Migrating expense amounts to integer cents")
+    # Rebuild from the table's own definition so every existing column and
+    # constraint survives; only the amount type changes
+    create_sql = conn.execute(
+        "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'expenses'"
+    ).fetchone()[0]
+    conn.execute("ALTER TABLE expenses RENAME TO expenses_old")
+    conn.execute(_AMOUNT_TYPE_RE.sub(r"\1INTEGER", create_sql, count=1))
+
+    names = [column[1] for column in columns]
+    selected = [
+        "CAST(ROUND(amount * 100) AS INTEGER)" if name == "amount" else name
+        for name in names
+    ]
+    conn.execute(
+        f"INSERT INTO expenses ({', '.join(names)}) "
+        f"SELECT {', '.join(selected)} FROM expenses_old"
+    )
+    # Dropping the old table also drops its indexes; apply_schema recreates them
+    conn.execute("DROP TABLE expenses_old")
+
+
+def _add_month_column(conn: sqlite3.Connection):
+    """Add the generated ym column to tables created before it existed"""
+    columns = conn.execute("PRAGMA table_xinfo(expenses)").fetchall()
+    if all(column[1] != "ym" for column in columns):
+        conn.execute(_ADD_YM_COLUMN_SQL)
@@ -82,7 +82,7 @@ def generate_test_categories():
     print("Generating sample categories...")
     db_config = DatabaseConfig()
     db_config.initialize_database()  # Ensure tables exist
-    service = DatabaseService()
+    service = DatabaseService.get_default()
     # First, get existing categories
     existing_categories = service.get_all_categories()
     existing_names = [cat["name"] for cat in existing_categories]
@@ -107,7 +107,7 @@ def generate_test_categories():
 def generate_sample_expenses(count=100, year=2024):
     """Generate sample expense data"""
     print(f"Generating {count} sample expenses for year {year}...")
-    service = DatabaseService()
+    service = DatabaseService.get_default()
     # Get available categories
     categories = service.get_all_categories()
     if not categories:
@@ -180,7 +180,7 @@ def generate_test_database(expense_count=50):
     # Generate expenses
     expense_count = generate_sample_expenses(count=expense_count)
     # Show summary
-    service = DatabaseService()
+    service = DatabaseService.get_default()
     total_expenses = len(service.get_all_expenses())
     total_categories = len(service.get_all_categories())
     print("\n" + "=" * 60)
@@ -206,12 +206,10 @@ def clear_test_data():
     confirm = input("Are you sure you want to clear ALL expense data? (yes/no): ")
     if confirm.lower() == "yes":
         try:
-            conn = DatabaseConfig().get_connection()
-            cursor = conn.cursor()
-            cursor.execute("DELETE FROM expenses")
-            rows_deleted = cursor.rowcount
-            conn.commit()
-            conn.close()
+            with DatabaseConfig().get_connection_context() as conn:
+                # Commits on success and rolls back on error
+                with conn:
+                    rows_deleted = conn.execute("DELETE FROM expenses").rowcount
             print(f"✓ Deleted {rows_deleted} expense records")
         except Exception as e:
             print(f"✗ Error clearing data: {e}")
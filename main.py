@@ -31,6 +31,7 @@ class ExpenseTrackerApp:
         # Initialize database
         db_config = DatabaseConfig()
         db_config.initialize_database()
+        db_config.close()
 
     def clear_screen(self):
         """Clear terminal screen"""
@@ -6,7 +6,7 @@ Expense Model for Daily Expense Tracker.
 
 from dataclasses import dataclass
 from datetime import date
-from decimal import Decimal
+from decimal import ROUND_HALF_UP, Decimal
 from typing import Optional
 
 @dataclass
@@ -27,3 +27,15 @@ class Expense:
             "description": self.description,
             "created_at": self.created_at,
         }
+
+    def _db_tuple(self) -> tuple:
+        """Return the (date, category, amount_cents, description) row stored in SQLite"""
+        amount = self.amount
+        if not isinstance(amount, Decimal):
+            amount = Decimal(str(amount or 0))
+        return (
+            self.date or "",  # bound as ISO text by the sqlite3 date adapter
+            self.category,
+            int((amount * 100).to_integral_value(rounding=ROUND_HALF_UP)),
+            self.description,
+        )
@@ -14,7 +14,7 @@ from collections import Counter
 from datetime import date, datetime, timedelta
 from typing import Any, Dict, List
 
-from .database_service import DatabaseService
+from .database_service import DatabaseService, ExpenseRow
 
 class AnalysisService:
 
@@ -22,31 +22,35 @@ class AnalysisService:
 
     def __init__(self):
 
-        self.db_service = DatabaseService()
+        self.db_service = DatabaseService.get_default()
 
     def get_yearly_summary(self, year: int) -> Dict[str, Any]:
 
         """Get yearly expense summary"""
 
-        monthly_totals = []
+        # One grouped query for the whole year instead of one per month
 
-        for month in range(1, 13):
+        yearly = self.db_service.get_yearly_summary(year)
 
-            summary = self.db_service.get_monthly_summary(year, month)
+        monthly_totals = [
 
-            if summary['total_expenses'] > 0:
+            {
 
-                monthly_totals.append({
+                'month': int(item['month']),
 
-                    'month': month,
+                'year': year,
 
-                    'year': year,
+                'total': item['total'],
 
-                    'total': summary['total_expenses'],
+                'transaction_count': item['count']
 
-                    'transaction_count': len(self.db_service.get_expenses_by_month(year, month))
+            }
 
-                })
+            for item in yearly['monthly_breakdown']
+
+            if item['total'] > 0
+
+        ]
 
         total_year = sum(item['total'] for item in monthly_totals)
 
@@ -116,13 +120,13 @@ class AnalysisService:
 
         """Analyze spending patterns between dates"""
 
-        expenses = self.db_service.get_expenses_by_date_range(start_date, end_date)
+        expenses = self.db_service.get_expenses_by_date_range(start_date, end_date, as_rows=True)
 
         if not expenses:
 
             return {'message': 'No expenses in date range'}
 
-        amounts = [exp['amount'] for exp in expenses]
+        amounts = [exp.amount for exp in expenses]
 
         total = sum(amounts)
 
@@ -132,7 +136,7 @@ class AnalysisService:
 
         for exp in expenses:
 
-            exp_date = datetime.strptime(exp['date'], '%Y-%m-%d').date()
+            exp_date = datetime.strptime(exp.date, '%Y-%m-%d').date()
 
             weekdays.append(exp_date.strftime('%A'))
 
@@ -158,7 +162,7 @@ class AnalysisService:
 
         }
 
-    def _get_category_distribution(self, expenses: List[Dict]) -> Dict[str, float]:
+    def _get_category_distribution(self, expenses: List[ExpenseRow]) -> Dict[str, float]:
 
         """Helper to get category distribution"""
 
@@ -166,9 +170,9 @@ class AnalysisService:
 
         for exp in expenses:
 
-            category = exp['category']
+            category = exp.category
 
-            amount = exp['amount']
+            amount = exp.amount
 
             category_totals[category] = category_totals.get(category, 0) + amount
 
@@ -6,18 +6,238 @@ Handles database operations for the expense tracker
 
 import sqlite3
 import logging
-from datetime import date
-from decimal import Decimal
-from typing import List, Optional, Dict, Any, Union
+import queue
+import threading
+from collections import namedtuple
+from contextlib import contextmanager
+from datetime import date, timedelta
+from decimal import ROUND_HALF_UP, Decimal
+from functools import lru_cache
+from itertools import product
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
 from pathlib import Path
 
+from config.schema import SCHEMA_VERSION, apply_schema
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Bind date objects as ISO strings inside sqlite3 instead of converting them
+# in Python first (the built-in default adapter is deprecated since 3.12)
+sqlite3.register_adapter(date, date.isoformat)
+
+# How long a connection waits on a locked database before raising
+BUSY_TIMEOUT_SECONDS = 5.0
+
+# Number of committed writes between passive WAL checkpoints
+CHECKPOINT_INTERVAL = 1000
+
+# Prepared statements kept per connection (sqlite3 defaults to 128)
+STATEMENT_CACHE_SIZE = 256
+
+# Rows pulled per fetchmany() call when streaming query results
+FETCH_BATCH_SIZE = 256
+
+# Most read-only connections kept open for a file database
+READ_POOL_SIZE = 8
+
+# Applied once when the shared connection is opened
+_CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    # Under WAL this only syncs at checkpoints and stays crash-safe, so a batch
+    # commit costs one fsync instead of one per transaction
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",  # ~64 MB page cache, kept for the connection's lifetime
+    # Read pages straight from a 256 MB memory map instead of copying them
+    # through read() calls; ignored for in-memory databases
+    "PRAGMA mmap_size=268435456",
+)
+
+# Amounts are stored as INTEGER cents; whole amounts come back as ints
+_AMOUNT_COLUMN = "CASE WHEN amount % 100 = 0 THEN amount / 100 ELSE amount / 100.0 END"
+_EXPENSE_COLUMNS = (
+    f"id, date, category, {_AMOUNT_COLUMN} AS amount, description, created_at"
+)
+
+# Lightweight row type for internal consumers; field order matches _EXPENSE_COLUMNS
+ExpenseRow = namedtuple("ExpenseRow", "id date category amount description created_at")
+
+# Hot statements are kept as module constants so every call hands sqlite3 the
+# same string and hits its prepared-statement cache
+_INSERT_EXPENSE_SQL = (
+    "INSERT INTO expenses (date, category, amount, description) VALUES (?, ?, ?, ?)"
+)
+_SELECT_EXPENSE_BY_ID_SQL = f"SELECT {_EXPENSE_COLUMNS} FROM expenses WHERE id = ?"
+_UPDATE_EXPENSE_SQL = (
+    "UPDATE expenses SET date = ?, category = ?, amount = ?, description = ? WHERE id = ?"
+)
+_DELETE_EXPENSE_SQL = "DELETE FROM expenses WHERE id = ?"
+_BEGIN_WRITE_SQL = "BEGIN IMMEDIATE"
+_LAST_INSERT_ROWID_SQL = "SELECT last_insert_rowid()"
+_DATA_VERSION_SQL = "PRAGMA data_version"
+_USER_VERSION_SQL = "PRAGMA user_version"
+
+
+def _build_expenses_sql(by_date: bool, by_category: bool, paged: bool) -> str:
+    """Compose one variant of the filtered, newest-first expense query"""
+    query = f"SELECT {_EXPENSE_COLUMNS} FROM expenses WHERE 1=1"
+    if by_date:
+        query += " AND date >= ? AND date < ?"
+    if by_category:
+        query += " AND category = ?"
+    query += " ORDER BY date DESC, created_at DESC"
+    if paged:
+        query += " LIMIT ? OFFSET ?"
+    return query
+
+
+# Every (date range, category, paged) combination, built once at import so
+# history queries never concatenate SQL and always reuse the same statements
+_EXPENSES_SQL = {
+    flags: _build_expenses_sql(*flags) for flags in product((False, True), repeat=3)
+}
+# LIMIT -1 means no limit in SQLite, so one statement covers every page size
+_SELECT_ALL_EXPENSES_SQL = _EXPENSES_SQL[(False, False, True)]
+_SELECT_CATEGORIES_SQL = "SELECT * FROM categories ORDER BY name"
+_MONTHLY_CATEGORY_BREAKDOWN_SQL = """
+    SELECT
+        category,
+        SUM(amount) as total,
+        COUNT(*) as count,
+        COALESCE(
+            SUM(amount) * 100.0 / NULLIF(SUM(SUM(amount)) OVER (), 0), 0
+        ) as percentage
+    FROM expenses
+    WHERE ym = ?
+    GROUP BY category
+    ORDER BY total DESC
+"""
+_YEARLY_MONTH_BREAKDOWN_SQL = """
+    SELECT
+        substr(ym, 6, 2) as month,
+        SUM(amount) as total,
+        COUNT(*) as count
+    FROM expenses
+    WHERE ym >= ? AND ym <= ?
+    GROUP BY ym
+    ORDER BY ym
+"""
+
+
+# Zero-padded month numbers as returned in yearly breakdowns
+_MONTH_KEYS = tuple(f"{month:02d}" for month in range(1, 13))
+
+
+@lru_cache(maxsize=256)
+def _month_bounds(year: int, month: int) -> Tuple[str, str]:
+    """Return the half-open ISO date range [start, end) covering a month"""
+    next_year, next_month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return f"{year:04d}-{month:02d}-01", f"{next_year:04d}-{next_month:02d}-01"
+
+
+@lru_cache(maxsize=64)
+def _year_bounds(year: int) -> Tuple[str, str]:
+    """Return the half-open ISO date range [start, end) covering a year"""
+    return f"{year:04d}-01-01", f"{year + 1:04d}-01-01"
+
+
+@lru_cache(maxsize=256)
+def _ym(year: int, month: int) -> str:
+    """Return the "YYYY-MM" value of the generated ym column for a month"""
+    return f"{year:04d}-{month:02d}"
+
+
+@lru_cache(maxsize=64)
+def _year_ym_bounds(year: int) -> Tuple[str, str]:
+    """Return the inclusive ym range ("YYYY-01", "YYYY-12") covering a year"""
+    return _ym(year, 1), _ym(year, 12)
+
+
+def _to_cents(amount: Any) -> int:
+    """Convert an amount (Decimal, int, float or numeric string) to integer cents"""
+    if amount is None:
+        return 0
+    if isinstance(amount, int):
+        return amount * 100
+    if not isinstance(amount, Decimal):
+        # Through str so floats keep the value the user typed, not the binary one
+        amount = Decimal(str(amount))
+    return int((amount * 100).to_integral_value(rounding=ROUND_HALF_UP))
+
+
+def _from_cents(cents: Optional[int]) -> Union[int, float]:
+    """Convert integer cents back to currency units"""
+    if not cents:
+        return 0
+    return cents // 100 if cents % 100 == 0 else cents / 100
+
+
+def _month_key(date_str: Union[str, date]) -> Optional[Tuple[int, int]]:
+    """Return (year, month) for a date or ISO date string, or None if unparseable"""
+    if isinstance(date_str, date):
+        return date_str.year, date_str.month
+    try:
+        return int(date_str[:4]), int(date_str[5:7])
+    except (TypeError, ValueError):
+        return None
+
+
+class ConnectionPool:
+    """Fixed-size pool of connections, opened lazily and reused across calls"""
+
+    def __init__(self, connect: Callable[[], sqlite3.Connection], size: int = READ_POOL_SIZE):
+        self._connect = connect
+        self._size = size
+        self._opened = 0
+        # LIFO so the most recently used connection, with the warmest cache, goes out first
+        self._idle: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def acquire(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a connection and put it back afterwards instead of closing it"""
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                can_open = self._opened < self._size
+                if can_open:
+                    self._opened += 1
+            if can_open:
+                try:
+                    conn = self._connect()
+                except Exception:
+                    with self._lock:
+                        self._opened -= 1
+                    raise
+            else:
+                conn = self._idle.get()
+
+        try:
+            yield conn
+        finally:
+            self._idle.put(conn)
+
+    def close(self):
+        """Close every idle connection"""
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            conn.close()
+            with self._lock:
+                self._opened -= 1
+
 
 class DatabaseService:
     """Service class for database operations"""
 
+    # Shared instance for the default database file, see get_default()
+    _default: Optional["DatabaseService"] = None
+    _default_lock = threading.Lock()
+
     def __init__(self, db_path: str = None):
         """Initialize database service"""
         if db_path is None:
@@ -29,8 +249,26 @@ class DatabaseService:
             self.db_path = Path(db_path)
             self.in_memory = str(db_path) == ":memory:"
         
-        # For in-memory databases, we need to keep a connection open
-        self._connection = None
+        # One long-lived connection so the page and statement caches survive
+        # between calls; the lock serialises access from multiple threads
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+
+        # Under WAL, readers don't block each other or the writer, so plain
+        # reads use pooled connections; an in-memory database is private to
+        # its connection and has to stay on the shared one
+        self._read_pool: Optional[ConnectionPool] = (
+            None if self.in_memory else ConnectionPool(self._connect)
+        )
+
+        # Committed writes since the last WAL checkpoint
+        self._op_counter = 0
+
+        # Query result caches, invalidated by writes
+        self._categories_cache: Optional[List[Dict]] = None
+        self._summary_cache: Dict[Tuple[int, int], Dict[str, Any]] = {}
+        # PRAGMA data_version seen when the caches were last validated
+        self._data_version: Optional[int] = None
         
         # Create directory if it doesn't exist (for file-based databases)
         if not self.in_memory:
@@ -39,188 +277,160 @@ class DatabaseService:
         # Initialize database on startup
         self.initialize_database()
 
+    @classmethod
+    def get_default(cls) -> "DatabaseService":
+        """Return the process-wide service for the default database, creating it once"""
+        with cls._default_lock:
+            if cls._default is None:
+                cls._default = cls()
+            return cls._default
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection in autocommit mode; writes use explicit transactions"""
+        conn = sqlite3.connect(
+            str(self.db_path),
+            timeout=BUSY_TIMEOUT_SECONDS,
+            isolation_level=None,
+            check_same_thread=False,
+            cached_statements=STATEMENT_CACHE_SIZE,
+        )
+        conn.row_factory = sqlite3.Row
+        for pragma in _CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
     def get_connection(self) -> sqlite3.Connection:
-        """Get database connection - handles in-memory databases specially"""
+        """Get the shared database connection, opening it on first use"""
         try:
-            if self.in_memory:
-                # For in-memory databases, reuse the same connection
+            with self._lock:
                 if self._connection is None:
-                    self._connection = sqlite3.connect(str(self.db_path))
-                    self._connection.row_factory = sqlite3.Row
+                    self._connection = self._connect()
                 return self._connection
-            else:
-                # For file-based databases, create new connection each time
-                conn = sqlite3.connect(str(self.db_path))
-                conn.row_factory = sqlite3.Row
-                return conn
         except sqlite3.Error as e:
             logger.error(f"Database connection error: {e}")
             raise
 
+    @contextmanager
+    def _locked_connection(self):
+        """Yield the shared connection while holding the service lock"""
+        with self._lock:
+            yield self.get_connection()
+
+    @contextmanager
+    def _read_connection(self):
+        """Yield a pooled connection for reads, or the locked shared one in memory"""
+        if self._read_pool is None:
+            with self._locked_connection() as conn:
+                yield conn
+        else:
+            with self._read_pool.acquire() as conn:
+                yield conn
+
+    @contextmanager
+    def _write_transaction(self):
+        """Run writes inside BEGIN IMMEDIATE so the write lock is taken up front"""
+        with self._locked_connection() as conn:
+            conn.execute(_BEGIN_WRITE_SQL)
+            try:
+                yield conn
+                conn.commit()
+            except BaseException:
+                conn.rollback()
+                raise
+            self._op_counter += 1
+            if self._op_counter >= CHECKPOINT_INTERVAL:
+                self._op_counter = 0
+                try:
+                    # Keep the -wal file from growing without bound during imports
+                    conn.execute("PRAGMA wal_checkpoint(PASSIVE)")
+                except sqlite3.Error as e:
+                    logger.warning(f"WAL checkpoint failed: {e}")
+
+    def _invalidate_summary_cache(self, month_key: Optional[Tuple[int, int]] = None):
+        """Drop the cached summary for a month, or every summary if unknown"""
+        if month_key is None:
+            self._summary_cache.clear()
+        else:
+            self._summary_cache.pop(month_key, None)
+
+    def _drop_stale_caches(self, conn: sqlite3.Connection):
+        """Clear the result caches if another connection committed since the last check"""
+        data_version = conn.execute(_DATA_VERSION_SQL).fetchone()[0]
+        if data_version != self._data_version:
+            self._data_version = data_version
+            self._summary_cache.clear()
+            self._categories_cache = None
+
     def close(self):
-        """Close the database connection (important for in-memory databases)"""
-        if self._connection:
-            self._connection.close()
-            self._connection = None
+        """Close the shared database connection"""
+        with self._lock:
+            if self._connection:
+                try:
+                    # Refresh planner statistics and fold the WAL back into the database
+                    self._connection.execute("PRAGMA optimize")
+                    self._connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+                except sqlite3.Error as e:
+                    logger.warning(f"Database maintenance on close failed: {e}")
+                self._connection.close()
+                self._connection = None
+            if self._read_pool is not None:
+                self._read_pool.close()
 
     def initialize_database(self):
         """Initialize database tables"""
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
+            with self._locked_connection() as conn:
+                if conn.execute(_USER_VERSION_SQL).fetchone()[0] >= SCHEMA_VERSION:
+                    # Schema already current: skip the DDL and seed inserts
+                    return
 
-            # Create expenses table
-            cursor.execute(
-                """
-                CREATE TABLE IF NOT EXISTS expenses (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    date DATE NOT NULL,
-                    category VARCHAR(50) NOT NULL,
-                    amount DECIMAL(10,2) NOT NULL,
-                    description TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """
-            )
-
-            # Create categories table
-            cursor.execute(
-                """
-                CREATE TABLE IF NOT EXISTS categories (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name VARCHAR(50) UNIQUE NOT NULL,
-                    budget_limit DECIMAL(10,2) DEFAULT NULL,
-                    description TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """
-            )
-
-            # Insert default categories
-            default_categories = [
-                ("Makanan & Minuman", None, "Pengeluaran untuk makanan dan minuman"),
-                ("Transportasi", None, "Pengeluaran untuk transportasi"),
-                ("Belanja", None, "Pengeluaran untuk belanja"),
-                ("Hiburan", None, "Pengeluaran untuk hiburan"),
-                ("Kesehatan", None, "Pengeluaran untuk kesehatan"),
-                ("Pendidikan", None, "Pengeluaran untuk pendidikan"),
-                ("Tagihan", None, "Pengeluaran untuk tagihan"),
-                ("Lain-lain", None, "Pengeluaran lainnya"),
-            ]
-
-            for category_name, budget_limit, description in default_categories:
-                cursor.execute(
-                    "INSERT OR IGNORE INTO categories (name, budget_limit, description) VALUES (?, ?, ?)",
-                    (category_name, budget_limit, description),
-                )
-
-            # Create indexes for better performance
-            cursor.execute(
-                "CREATE INDEX IF NOT EXISTS idx_expenses_date ON expenses(date)"
-            )
-            cursor.execute(
-                "CREATE INDEX IF NOT EXISTS idx_expenses_category ON expenses(category)"
-            )
-            cursor.execute(
-                "CREATE INDEX IF NOT EXISTS idx_expenses_date_category ON expenses(date, category)"
-            )
+            with self._write_transaction() as conn:
+                apply_schema(conn)
 
-            # Only commit if not using shared in-memory connection
-            if not self.in_memory:
-                conn.commit()
-                conn.close()
-            else:
-                conn.commit()
-                
+            self._categories_cache = None
             logger.info("Database initialized successfully")
 
         except sqlite3.Error as e:
             logger.error(f"Database initialization error: {e}")
             raise
 
-    def _extract_expense_data(self, expense: Union[Dict, Any]) -> Dict[str, Any]:
-        """Extract data from either Expense object or dictionary"""
-        try:
-            if isinstance(expense, dict):
-                # It's a dictionary
-                date_value = expense.get("date")
-                category = expense.get("category")
-                amount = expense.get("amount")
-                description = expense.get("description", "")
-                return {
-                    "date": date_value,
-                    "category": category,
-                    "amount": amount,
-                    "description": description,
-                }
-            else:
-                # It's an Expense object - access attributes directly
-                date_value = getattr(expense, "date", None)
-                category = getattr(expense, "category", None)
-                amount = getattr(expense, "amount", None)
-                description = getattr(expense, "description", "")
-                return {
-                    "date": date_value,
-                    "category": category,
-                    "amount": amount,
-                    "description": description,
-                }
-        except Exception as e:
-            logger.error(f"Error extracting expense data: {e}")
-            raise ValueError(f"Cannot extract data from expense object: {type(expense)}")
-
-    def _prepare_expense_for_db(self, expense_data: Dict[str, Any]) -> tuple:
-        """Prepare expense data for database insertion"""
-        date_value = expense_data.get("date")
-        category = expense_data.get("category")
-        amount = expense_data.get("amount")
-        description = expense_data.get("description", "")
-
-        # Convert date to string if it's a date object
-        if hasattr(date_value, "isoformat"):
-            date_str = date_value.isoformat()
+    def _row_tuple(self, expense: Union[Dict, Any]) -> tuple:
+        """Build the (date, category, amount, description) row for an Expense object or dict"""
+        # Expense objects already know their storage row
+        db_tuple = getattr(expense, "_db_tuple", None)
+        if db_tuple is not None:
+            return db_tuple()
+
+        if isinstance(expense, dict):
+            get = expense.get
         else:
-            date_str = str(date_value) if date_value else ""
+            def get(key, default=None):
+                return getattr(expense, key, default)
 
-        # Convert amount to float
-        if isinstance(amount, Decimal):
-            amount_float = float(amount)
-        elif amount is not None:
-            amount_float = float(amount)
+        date_value = get("date")
+        amount = get("amount")
+
+        # Plain dates are bound by the registered adapter; datetimes and other
+        # values are still converted here
+        if type(date_value) is date:
+            date_str = date_value
+        elif hasattr(date_value, "isoformat"):
+            date_str = date_value.isoformat()
         else:
-            amount_float = 0.0
+            date_str = str(date_value) if date_value else ""
 
-        return (date_str, category, amount_float, description)
+        return (date_str, get("category"), _to_cents(amount), get("description", ""))
 
     def add_expense(self, expense: Union[Dict, Any]) -> int:
         """Add a new expense to database - HANDLES BOTH Expense objects AND dictionaries"""
         try:
-            # Extract data from expense object/dictionary
-            expense_data = self._extract_expense_data(expense)
-            
-            # Prepare data for database
-            db_data = self._prepare_expense_for_db(expense_data)
-
-            conn = self.get_connection()
-            cursor = conn.cursor()
-
-            cursor.execute(
-                """
-                INSERT INTO expenses (date, category, amount, description)
-                VALUES (?, ?, ?, ?)
-                """,
-                db_data,
-            )
+            # Prepare data for database from expense object/dictionary
+            db_data = self._row_tuple(expense)
 
-            expense_id = cursor.lastrowid
-            
-            # Only commit if not using shared in-memory connection
-            if not self.in_memory:
-                conn.commit()
-                conn.close()
-            else:
-                conn.commit()
+            with self._write_transaction() as conn:
+                expense_id = conn.execute(_INSERT_EXPENSE_SQL, db_data).lastrowid
 
+            self._invalidate_summary_cache(_month_key(db_data[0]))
             logger.info(f"Expense added with ID: {expense_id}")
             return expense_id
 
@@ -231,61 +441,184 @@ class DatabaseService:
             logger.error(f"Unexpected error adding expense: {e}")
             raise
 
+    def add_batch_expenses(self, expenses: List[Union[Dict, Any]]) -> List[int]:
+        """Add several expenses in one statement and return their IDs in input order"""
+        rows = [self._row_tuple(expense) for expense in expenses]
+        if not rows:
+            return []
+
+        try:
+            with self._write_transaction() as conn:
+                conn.executemany(
+                    _INSERT_EXPENSE_SQL,
+                    rows,
+                )
+                # The write lock is held for the whole batch, so the new rowids
+                # are contiguous and end at last_insert_rowid().
+                last_id = conn.execute(_LAST_INSERT_ROWID_SQL).fetchone()[0]
+
+            for month_key in {_month_key(row[0]) for row in rows}:
+                self._invalidate_summary_cache(month_key)
+
+            first_id = last_id - len(rows) + 1
+            logger.info(f"{len(rows)} expenses added starting at ID: {first_id}")
+            return list(range(first_id, last_id + 1))
+
+        except sqlite3.Error as e:
+            logger.error(f"Error adding expenses in batch: {e}")
+            raise
+
+    def add_expenses_bulk(self, expenses: List[Union[Dict, Any]]) -> List[int]:
+        """Add several expenses in one transaction (alias for add_batch_expenses)"""
+        return self.add_batch_expenses(expenses)
+
+    def _iter_rows(
+        self,
+        query: str,
+        params: Sequence[Any],
+        make_row: Optional[Callable[[tuple], Any]] = None,
+    ) -> Iterator[Any]:
+        """Yield result rows, fetching FETCH_BATCH_SIZE rows at a time
+
+        Rows are dicts unless ``make_row`` is given to build them from tuples.
+
+        The connection is held until the generator is exhausted or closed.
+        """
+        with self._read_connection() as conn:
+            # Plain tuples zipped with the column names once are cheaper than
+            # building each dict through the sqlite3.Row mapping protocol
+            cursor = conn.cursor()
+            cursor.row_factory = None
+            cursor.arraysize = FETCH_BATCH_SIZE
+            cursor.execute(query, params)
+            if make_row is None:
+                columns = [column[0] for column in cursor.description]
+
+                def make_row(row):
+                    return dict(zip(columns, row))
+
+            while rows := cursor.fetchmany():
+                yield from map(make_row, rows)
+
+    @staticmethod
+    def _expenses_query(
+        month: Optional[int],
+        year: Optional[int],
+        category: Optional[str],
+        limit: Optional[int],
+        offset: Optional[int],
+    ) -> Tuple[str, List[Any]]:
+        """Pick the prebuilt expense query for the given filters and bind its parameters"""
+        params: List[Any] = []
+
+        if month and year:
+            params.extend(_month_bounds(year, month))
+        elif year:
+            params.extend(_year_bounds(year))
+        by_date = bool(params)
+
+        if category:
+            params.append(category)
+
+        paged = limit is not None or offset is not None
+        if paged:
+            # LIMIT -1 means no limit in SQLite
+            params.extend([-1 if limit is None else limit, offset or 0])
+
+        return _EXPENSES_SQL[(by_date, bool(category), paged)], params
+
+    def iter_expenses(
+        self,
+        month: Optional[int] = None,
+        year: Optional[int] = None,
+        category: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+    ) -> Iterator[Dict]:
+        """Stream expenses with the same filters as get_expenses"""
+        return self._iter_rows(*self._expenses_query(month, year, category, limit, offset))
+
+    def iter_expense_rows(
+        self,
+        month: Optional[int] = None,
+        year: Optional[int] = None,
+        category: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+    ) -> Iterator[ExpenseRow]:
+        """Stream expenses as ExpenseRow namedtuples (use ``._asdict()`` for a dict)"""
+        query, params = self._expenses_query(month, year, category, limit, offset)
+        return self._iter_rows(query, params, ExpenseRow._make)
+
     def get_expenses(
         self,
         month: Optional[int] = None,
         year: Optional[int] = None,
         category: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
     ) -> List[Dict]:
-        """Get expenses with optional filters - COMPATIBLE WITH expense_service.py"""
+        """Get expenses with optional filters and pagination - COMPATIBLE WITH expense_service.py"""
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-
-            query = "SELECT * FROM expenses WHERE 1=1"
-            params = []
+            return list(self.iter_expenses(month, year, category, limit, offset))
 
-            if month and year:
-                query += " AND strftime('%Y', date) = ? AND strftime('%m', date) = ?"
-                params.extend([str(year), f"{month:02d}"])
-            elif year:
-                query += " AND strftime('%Y', date) = ?"
-                params.append(str(year))
+        except sqlite3.Error as e:
+            logger.error(f"Error getting expenses: {e}")
+            return []
 
-            if category:
-                query += " AND category = ?"
-                params.append(category)
+    def get_expenses_by_date_range(
+        self,
+        start_date: Union[str, date],
+        end_date: Union[str, date],
+        category: Optional[str] = None,
+        as_rows: bool = False,
+    ) -> List[Union[Dict, ExpenseRow]]:
+        """Get expenses dated start_date through end_date (inclusive), newest first
+
+        With ``as_rows`` the expenses come back as ExpenseRow namedtuples, which
+        are cheaper than dicts for callers that only aggregate them.
+        """
+        if isinstance(start_date, str):
+            start_date = date.fromisoformat(start_date)
+        if isinstance(end_date, str):
+            end_date = date.fromisoformat(end_date)
+
+        # Same prebuilt half-open range query as the month and year filters
+        params: List[Any] = [start_date.isoformat(), (end_date + timedelta(days=1)).isoformat()]
+        if category:
+            params.append(category)
+        try:
+            query = _EXPENSES_SQL[(True, bool(category), False)]
+            return list(self._iter_rows(query, params, ExpenseRow._make if as_rows else None))
 
-            query += " ORDER BY date DESC, created_at DESC"
+        except sqlite3.Error as e:
+            logger.error(f"Error getting expenses by date range: {e}")
+            return []
 
-            cursor.execute(query, params)
-            expenses = [dict(row) for row in cursor.fetchall()]
-            
-            # Only close if not using shared in-memory connection
-            if not self.in_memory:
-                conn.close()
+    def iter_all_expenses(
+        self, limit: Optional[int] = None, offset: Optional[int] = None
+    ) -> Iterator[Dict]:
+        """Stream all expenses, newest first, with optional pagination"""
+        params = (-1 if limit is None else limit, offset or 0)
+        return self._iter_rows(_SELECT_ALL_EXPENSES_SQL, params)
 
-            return expenses
+    def get_all_expenses(
+        self, limit: Optional[int] = None, offset: Optional[int] = None
+    ) -> List[Dict]:
+        """Get all expenses, newest first, with optional pagination"""
+        try:
+            return list(self.iter_all_expenses(limit, offset))
 
         except sqlite3.Error as e:
-            logger.error(f"Error getting expenses: {e}")
+            logger.error(f"Error getting all expenses: {e}")
             return []
 
     def get_expense_by_id(self, expense_id: int) -> Optional[Dict]:
         """Get expense by ID"""
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-
-            cursor.execute("SELECT * FROM expenses WHERE id = ?", (expense_id,))
-
-            row = cursor.fetchone()
-            
-            # Only close if not using shared in-memory connection
-            if not self.in_memory:
-                conn.close()
-
-            return dict(row) if row else None
+            with self._read_connection() as conn:
+                row = conn.execute(_SELECT_EXPENSE_BY_ID_SQL, (expense_id,)).fetchone()
+                return dict(row) if row else None
 
         except sqlite3.Error as e:
             logger.error(f"Error getting expense {expense_id}: {e}")
@@ -294,33 +627,18 @@ class DatabaseService:
     def update_expense(self, expense_id: int, expense: Union[Dict, Any]) -> bool:
         """Update an existing expense - HANDLES BOTH Expense objects AND dictionaries"""
         try:
-            # Extract data from expense object/dictionary
-            expense_data = self._extract_expense_data(expense)
-            
-            # Prepare data for database
-            db_data = self._prepare_expense_for_db(expense_data)
-
-            conn = self.get_connection()
-            cursor = conn.cursor()
+            # Prepare data for database from expense object/dictionary
+            db_data = self._row_tuple(expense)
 
-            cursor.execute(
-                """
-                UPDATE expenses
-                SET date = ?, category = ?, amount = ?, description = ?
-                WHERE id = ?
-                """,
-                (*db_data, expense_id),
-            )
-
-            rows_affected = cursor.rowcount
-            if not self.in_memory:
-                conn.commit()
-                conn.close()
-            else:
-                conn.commit()
+            with self._write_transaction() as conn:
+                rows_affected = conn.execute(
+                    _UPDATE_EXPENSE_SQL, (*db_data, expense_id)
+                ).rowcount
 
             success = rows_affected > 0
             if success:
+                # The row may have moved out of another month
+                self._invalidate_summary_cache()
                 logger.info(f"Expense {expense_id} updated successfully")
             else:
                 logger.warning(f"Expense {expense_id} not found for update")
@@ -334,20 +652,12 @@ class DatabaseService:
     def delete_expense(self, expense_id: int) -> bool:
         """Delete an expense"""
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-
-            cursor.execute("DELETE FROM expenses WHERE id = ?", (expense_id,))
-
-            rows_affected = cursor.rowcount
-            if not self.in_memory:
-                conn.commit()
-                conn.close()
-            else:
-                conn.commit()
+            with self._write_transaction() as conn:
+                rows_affected = conn.execute(_DELETE_EXPENSE_SQL, (expense_id,)).rowcount
 
             success = rows_affected > 0
             if success:
+                self._invalidate_summary_cache()
                 logger.info(f"Expense {expense_id} deleted successfully")
             else:
                 logger.warning(f"Expense {expense_id} not found for deletion")
@@ -359,19 +669,17 @@ class DatabaseService:
             return False
 
     def get_all_categories(self) -> List[Dict]:
-        """Get all categories"""
+        """Get all categories (served from cache after the first query)"""
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
+            with self._locked_connection() as conn:
+                self._drop_stale_caches(conn)
+                if self._categories_cache is not None:
+                    return [dict(category) for category in self._categories_cache]
 
-            cursor.execute("SELECT * FROM categories ORDER BY name")
-            categories = [dict(row) for row in cursor.fetchall()]
-            
-            # Only close if not using shared in-memory connection
-            if not self.in_memory:
-                conn.close()
+                categories = [dict(row) for row in conn.execute(_SELECT_CATEGORIES_SQL)]
 
-            return categories
+                self._categories_cache = categories
+                return [dict(category) for category in categories]
 
         except sqlite3.Error as e:
             logger.error(f"Error getting categories: {e}")
@@ -384,119 +692,110 @@ class DatabaseService:
     def get_monthly_summary(self, year: int, month: int) -> Dict[str, Any]:
         """Get monthly expense summary - COMPATIBLE WITH expense_service.py"""
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-
-            # Get total expenses for the month
-            cursor.execute(
-                """
-                SELECT COALESCE(SUM(amount), 0) as total
-                FROM expenses
-                WHERE strftime('%Y', date) = ? AND strftime('%m', date) = ?
-                """,
-                (str(year), f"{month:02d}"),
-            )
-
-            total_row = cursor.fetchone()
-            total_expenses = total_row["total"] if total_row else 0
-
-            # Get category breakdown
-            cursor.execute(
-                """
-                SELECT category, SUM(amount) as total
-                FROM expenses
-                WHERE strftime('%Y', date) = ? AND strftime('%m', date) = ?
-                GROUP BY category
-                ORDER BY total DESC
-                """,
-                (str(year), f"{month:02d}"),
-            )
-
-            category_breakdown = [dict(row) for row in cursor.fetchall()]
-
-            # Only close if not using shared in-memory connection
-            if not self.in_memory:
-                conn.close()
-
-            return {
-                "year": year,
-                "month": month,
-                "total_expenses": total_expenses,
-                "category_breakdown": category_breakdown,
-            }
+            with self._locked_connection() as conn:
+                self._drop_stale_caches(conn)
+                cached = self._summary_cache.get((year, month))
+                if cached is not None:
+                    return self._copy_summary(cached)
+
+                # One grouped scan; the month totals are the sum of its groups
+                rows = conn.execute(
+                    _MONTHLY_CATEGORY_BREAKDOWN_SQL, (_ym(year, month),)
+                ).fetchall()
+
+                if not rows:
+                    # Empty month: nothing to aggregate or convert
+                    summary = self._empty_monthly_summary(year, month)
+                    self._summary_cache[(year, month)] = summary
+                    return self._copy_summary(summary)
+
+                # Positional unpacking skips sqlite3.Row's by-name lookups
+                category_breakdown = []
+                total_cents = transaction_count = 0
+                for category, total, count, percentage in rows:
+                    category_breakdown.append(
+                        {
+                            "category": category,
+                            "total": _from_cents(total),
+                            "percentage": percentage,
+                        }
+                    )
+                    total_cents += total
+                    transaction_count += count
+
+                summary = {
+                    "year": year,
+                    "month": month,
+                    "total_expenses": _from_cents(total_cents),
+                    "transaction_count": transaction_count,
+                    "category_breakdown": category_breakdown,
+                }
+                self._summary_cache[(year, month)] = summary
+                return self._copy_summary(summary)
 
         except sqlite3.Error as e:
             logger.error(f"Error getting monthly summary: {e}")
-            # Only close if not using shared in-memory connection
-            if not self.in_memory and 'conn' in locals():
-                conn.close()
-            return {
-                "year": year,
-                "month": month,
-                "total_expenses": 0,
-                "category_breakdown": [],
-            }
+            return self._empty_monthly_summary(year, month)
+
+    @staticmethod
+    def _empty_monthly_summary(year: int, month: int) -> Dict[str, Any]:
+        """Summary returned for a month without expenses"""
+        return {
+            "year": year,
+            "month": month,
+            "total_expenses": 0,
+            "transaction_count": 0,
+            "category_breakdown": [],
+        }
+
+    @staticmethod
+    def _copy_summary(summary: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy a cached summary so callers can annotate it freely"""
+        return {
+            **summary,
+            "category_breakdown": [dict(item) for item in summary["category_breakdown"]],
+        }
 
     def get_yearly_summary(self, year: int) -> Dict[str, Any]:
         """Get yearly expense summary"""
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-
-            # Get total expenses for the year
-            cursor.execute(
-                """
-                SELECT COALESCE(SUM(amount), 0) as total, COUNT(*) as count
-                FROM expenses
-                WHERE strftime('%Y', date) = ?
-                """,
-                (str(year),),
-            )
+            with self._read_connection() as conn:
+                # One grouped scan; the year totals are the sum of its months
+                rows = conn.execute(
+                    _YEARLY_MONTH_BREAKDOWN_SQL, _year_ym_bounds(year)
+                ).fetchall()
+
+                # One entry per month, zero for months without expenses
+                monthly_breakdown = self._empty_monthly_breakdown()
+                total_cents = transaction_count = 0
+                for month, total, count in rows:
+                    entry = monthly_breakdown[int(month) - 1]
+                    entry["total"] = _from_cents(total)
+                    entry["count"] = count
+                    total_cents += total
+                    transaction_count += count
 
-            yearly_row = cursor.fetchone()
-            total_expenses = yearly_row["total"] if yearly_row else 0
-            total_count = yearly_row["count"] if yearly_row else 0
-
-            # Get monthly breakdown
-            cursor.execute(
-                """
-                SELECT 
-                    strftime('%m', date) as month,
-                    SUM(amount) as total,
-                    COUNT(*) as count
-                FROM expenses
-                WHERE strftime('%Y', date) = ?
-                GROUP BY strftime('%m', date)
-                ORDER BY month
-                """,
-                (str(year),),
-            )
-
-            monthly_breakdown = [dict(row) for row in cursor.fetchall()]
-
-            # Only close if not using shared in-memory connection
-            if not self.in_memory:
-                conn.close()
-
-            return {
-                "year": year,
-                "total_expenses": total_expenses,
-                "transaction_count": total_count,
-                "monthly_breakdown": monthly_breakdown,
-            }
+                return {
+                    "year": year,
+                    "total_expenses": _from_cents(total_cents),
+                    "transaction_count": transaction_count,
+                    "monthly_breakdown": monthly_breakdown,
+                }
 
         except sqlite3.Error as e:
             logger.error(f"Error getting yearly summary: {e}")
-            # Only close if not using shared in-memory connection
-            if not self.in_memory and 'conn' in locals():
-                conn.close()
             return {
                 "year": year,
                 "total_expenses": 0,
                 "transaction_count": 0,
-                "monthly_breakdown": [],
+                "monthly_breakdown": self._empty_monthly_breakdown(),
             }
 
+    @staticmethod
+    def _empty_monthly_breakdown() -> List[Dict[str, Any]]:
+        """Twelve zeroed month entries for a yearly summary"""
+        return [{"month": month, "total": 0, "count": 0} for month in _MONTH_KEYS]
+
 
 # Test function to verify all methods work
 def test_database_service():
@@ -16,7 +16,12 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from models.expense_model import Expense
 from services.database_service import DatabaseService
-from utils.validation import parse_amount, validate_amount, validate_date
+from utils.validation import (
+    parse_amount,
+    validate_amount,
+    validate_amount_batch,
+    validate_date,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -24,16 +29,18 @@ logger = logging.getLogger(__name__)
 class ExpenseService:
     """Business logic layer for expense operations"""
 
-    def __init__(self):
-        self.db_service = DatabaseService()
+    def __init__(self, db_service: Optional[DatabaseService] = None):
+        # Defaults to the shared service for data/expenses.db
+        self.db_service = db_service if db_service is not None else DatabaseService.get_default()
 
     def create_expense(
         self, date_str: str, category: str, amount_str: str, description: str = ""
     ) -> Dict[str, Any]:
         """Create a new expense with validation"""
         try:
-            # Validate inputs
-            if not validate_date(date_str):
+            # Validate inputs; the parsed date is reused below
+            date_valid, expense_date = validate_date(date_str)
+            if not date_valid:
                 return {
                     "success": False,
                     "error": "Invalid date format. Use YYYY-MM-DD",
@@ -43,7 +50,6 @@ class ExpenseService:
                 return {"success": False, "error": "Invalid amount format"}
 
             # Parse inputs
-            expense_date = datetime.strptime(date_str, "%Y-%m-%d").date()
             amount = parse_amount(amount_str)
 
             if amount <= 0:
@@ -72,6 +78,45 @@ class ExpenseService:
             logger.error(f"Error creating expense: {e}")
             return {"success": False, "error": f"System error: {str(e)}"}
 
+    def create_expenses(self, rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Create many expenses in one transaction; rows use create_expense's fields"""
+        expenses = []
+        errors = []
+        amounts = validate_amount_batch([str(row.get("amount", "")) for row in rows])
+
+        for index, (row, (amount_valid, amount)) in enumerate(zip(rows, amounts), start=1):
+            date_valid, expense_date = validate_date(str(row.get("date", "")))
+            if not date_valid:
+                errors.append(f"Row {index}: Invalid date format. Use YYYY-MM-DD")
+                continue
+
+            if not amount_valid:
+                errors.append(f"Row {index}: Amount must be greater than 0")
+                continue
+
+            expenses.append(
+                Expense(
+                    date=expense_date,
+                    category=row.get("category", ""),
+                    amount=amount,
+                    description=row.get("description", ""),
+                )
+            )
+
+        if errors:
+            return {"success": False, "errors": errors, "error": errors[0]}
+
+        try:
+            expense_ids = self.db_service.add_batch_expenses(expenses)
+            return {
+                "success": True,
+                "expense_ids": expense_ids,
+                "message": f"{len(expense_ids)} expenses added successfully",
+            }
+        except Exception as e:
+            logger.error(f"Error creating expenses in batch: {e}")
+            return {"success": False, "error": f"System error: {str(e)}"}
+
     def get_expense_history(self, filters: Optional[Dict] = None) -> List[Dict]:
         """Get expense history with optional filters"""
         if filters is None:
@@ -85,15 +130,8 @@ class ExpenseService:
 
     def get_monthly_analysis(self, year: int, month: int) -> Dict[str, Any]:
         """Get detailed monthly analysis"""
-        summary = self.db_service.get_monthly_summary(year, month)
-
-        # Calculate percentages
-        total = summary.get("total_expenses", 0)
-        if total > 0:
-            for item in summary.get("category_breakdown", []):
-                item["percentage"] = (item["total"] / total) * 100
-
-        return summary
+        # Category percentages are computed by the summary query itself
+        return self.db_service.get_monthly_summary(year, month)
 
     def validate_expense_data(
         self, date_str: str, amount_str: str, category: str = ""
@@ -101,7 +139,7 @@ class ExpenseService:
         """Validate expense data before processing"""
         errors = []
 
-        if not validate_date(date_str):
+        if not validate_date(date_str)[0]:
             errors.append("Invalid date format. Use YYYY-MM-DD")
 
         if not validate_amount(amount_str):
@@ -121,8 +159,8 @@ class ExpenseService:
 
     def get_available_categories(self) -> List[str]:
         """Get list of available categories"""
-        categories = self.db_service.get_categories()
-        return [cat["name"] for cat in categories] if categories else []
+        # DatabaseService caches categories and notices writes from other connections
+        return [cat["name"] for cat in self.db_service.get_all_categories()]
 
     def delete_expense(self, expense_id: int) -> Dict[str, Any]:
         """Delete an expense"""
@@ -152,7 +190,7 @@ class ExpenseService:
                 return {"success": False, "error": validation["errors"][0]}
 
             # Parse inputs
-            expense_date = datetime.strptime(date_str, "%Y-%m-%d").date()
+            _, expense_date = validate_date(date_str)
             amount = parse_amount(amount_str)
 
             # Create expense object
@@ -4,184 +4,447 @@ Handles CSV, Excel exports and comprehensive reporting
 """
 
 import csv
-from datetime import datetime
+import io
+import math
+import os
+import re
+import threading
+import time
+import zipfile
+from contextlib import contextmanager, suppress
+from datetime import date
+from decimal import Decimal
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Optional
-
-import pandas as pd
-
-class ExportService:
-    def __init__(self):
-        self.export_dir = Path(__file__).parent.parent / "exports"
-        self.export_dir.mkdir(exist_ok=True)
-
-    def export_to_csv(self, expenses: List[Dict], filename: Optional[str] = None) -> str:
-        """Export expenses data to CSV format"""
-        if not filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"expenses_export_{timestamp}.csv"
-
-        filepath = self.export_dir / filename
-
-        with open(filepath, "w", newline="", encoding="utf-8") as csvfile:
-            if expenses:
-                all_keys = set()
-                for expense in expenses:
-                    all_keys.update(expense.keys())
-                fieldnames = sorted(all_keys)
-
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(expenses)
-
-        return str(filepath)
-
-    def export_to_excel(self, expenses: List[Dict], filename: Optional[str] = None) -> str:
-        """Export expenses data to Excel format with formatting"""
-        if not filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"expenses_export_{timestamp}.xlsx"
-
-        filepath = self.export_dir / filename
-
-        df = pd.DataFrame(expenses)
-
-        if "date" in df.columns:
-            df["date"] = pd.to_datetime(df["date"]).dt.strftime("%Y-%m-%d")
-
-        with pd.ExcelWriter(filepath, engine="openpyxl") as writer:
-            df.to_excel(writer, sheet_name="Expenses", index=False)
-
-            worksheet = writer.sheets["Expenses"]
-            for column in worksheet.columns:
-                max_length = 0
-                column_letter = column[0].column_letter
-
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-
-                adjusted_width = min(max_length + 2, 50)
-                worksheet.column_dimensions[column_letter].width = adjusted_width
-
-        return str(filepath)
-
-    def export_monthly_report(self, monthly_data: Dict, expenses: List[Dict]) -> str:
-        """Export comprehensive monthly report with multiple sheets"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = (
-            f"monthly_report_{monthly_data['year']}_{monthly_data['month']:02d}_{timestamp}.xlsx"
+from typing import Dict, List, Optional, Tuple
+from xml.sax.saxutils import escape
+
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font
+from openpyxl.utils import get_column_letter
+
+__all__ = ["ExportService"]
+
+try:
+    import xlsxwriter
+
+    # xlsxwriter streams XML straight into the zip and is much faster for workbooks
+    _EXCEL_ENGINE = "xlsxwriter"
+except ImportError:
+    _EXCEL_ENGINE = "openpyxl"
+
+try:
+    import polars as pl
+
+    _HAS_POLARS = True
+except ImportError:
+    _HAS_POLARS = False
+
+# Overridable with the EXPENSE_EXPORT_DIR environment variable
+_DEFAULT_EXPORT_DIR = Path(__file__).resolve().parent.parent / "exports"
+
+# 1 MiB write buffer so large exports reach the disk in a few big writes
+_CSV_BUFFER_SIZE = 1 << 20
+# Below this many rows polars' DataFrame setup costs more than it saves
+_POLARS_MIN_ROWS = 5000
+
+# From this many rows export_to_excel writes the sheet XML itself
+_RAW_XLSX_MIN_ROWS = 10000
+
+_HEADER_FONT = Font(bold=True)
+_MONEY_FORMAT = "Rp #,##0"
+
+# Fixed parts of a one-sheet workbook for _write_raw_xlsx; style 1 is the bold header
+_XML_DECLARATION = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+_RAW_XLSX_PARTS = {
+    "[Content_Types].xml": (
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" '
+        'ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" ContentType="application/'
+        'vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/'
+        'vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        '<Override PartName="/xl/styles.xml" ContentType="application/'
+        'vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+        "</Types>"
+    ),
+    "_rels/.rels": (
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Target="xl/workbook.xml" Type="http://schemas.'
+        'openxmlformats.org/officeDocument/2006/relationships/officeDocument"/>'
+        "</Relationships>"
+    ),
+    "xl/_rels/workbook.xml.rels": (
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Target="worksheets/sheet1.xml" Type="http://schemas.'
+        'openxmlformats.org/officeDocument/2006/relationships/worksheet"/>'
+        '<Relationship Id="rId2" Target="styles.xml" Type="http://schemas.'
+        'openxmlformats.org/officeDocument/2006/relationships/styles"/>'
+        "</Relationships>"
+    ),
+    "xl/styles.xml": (
+        '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+        '<fonts count="2"><font><sz val="11"/><name val="Calibri"/></font>'
+        '<font><b/><sz val="11"/><name val="Calibri"/></font></fonts>'
+        '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+        '<fill><patternFill patternType="gray125"/></fill></fills>'
+        '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+        '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/>'
+        "</cellStyleXfs>"
+        '<cellXfs count="2"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+        '<xf numFmtId="0" fontId="1" fillId="0" borderId="0" xfId="0" applyFont="1"/>'
+        "</cellXfs>"
+        '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+        "</styleSheet>"
+    ),
+}
+# Characters XML 1.0 forbids, and literal "_xHHHH_" runs that Excel would decode
+_OOXML_ESCAPE_RE = re.compile(r"_(?=x[0-9A-Fa-f]{4}_)|[\x00-\x08\x0b-\x1f\ufffe\uffff]")
+_RAW_WORKBOOK_XML = (
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets><sheet name="{name}" sheetId="1" r:id="rId1"/></sheets></workbook>'
+)
+
+
+def _timestamp(_strftime=time.strftime, _localtime=time.localtime) -> str:
+    """Current local time as YYYYmmdd_HHMMSS for export filenames"""
+    return _strftime("%Y%m%d_%H%M%S", _localtime())
+
+
+@contextmanager
+def _atomic_output(filepath: str):
+    """Yield a temporary path beside filepath, renamed over it once writing succeeds"""
+    directory, name = os.path.split(filepath)
+    # Same directory, so os.replace is a single rename; readers never see a partial file.
+    # Process and thread ids keep concurrent exports of one filename apart
+    temp_path = os.path.join(
+        directory, f".tmp{os.getpid()}-{threading.get_ident()}-{name}"
+    )
+    try:
+        yield temp_path
+        os.replace(temp_path, filepath)
+    except BaseException:
+        with suppress(FileNotFoundError):
+            os.unlink(temp_path)
+        raise
+
+
+def _format_date(value) -> Optional[str]:
+    """Render a date, datetime or ISO string as YYYY-MM-DD"""
+    if type(value) is str:
+        # Rows from the database already hold ISO strings
+        return value[:10]
+    if value is None:
+        return None
+    if hasattr(value, "isoformat"):
+        value = value.isoformat()
+    return str(value)[:10]
+
+
+def _report_date(value):
+    """A YYYY-MM-DD string as a date; anything else is written through unchanged"""
+    if not value:
+        return value
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        return value
+
+
+def _column(expenses: List[Dict], name: str) -> list:
+    """Values of one key across all rows, None where a row lacks it"""
+    try:
+        # Rows from one query all have every key: fetch them in C
+        return list(map(itemgetter(name), expenses))
+    except KeyError:
+        return [expense.get(name) for expense in expenses]
+
+
+def _csv_text(value) -> Optional[str]:
+    """A value as csv.writer renders it, or None for an empty field"""
+    if type(value) is str:
+        # polars quotes empty strings but leaves nulls bare, as csv.writer does
+        return value or None
+    if value is None:
+        return None
+    return str(value)
+
+
+def _to_columnar(expenses: List[Dict]) -> Tuple[List[str], List[list]]:
+    """Turn expense dicts into (fieldnames, one list per column) with dates as YYYY-MM-DD"""
+    # Columns in first-seen order, like a DataFrame built from the dicts
+    fieldnames = list(dict.fromkeys(key for expense in expenses for key in expense))
+    columns = [_column(expenses, name) for name in fieldnames]
+    if "date" in fieldnames:
+        date_index = fieldnames.index("date")
+        columns[date_index] = list(map(_format_date, columns[date_index]))
+    return fieldnames, columns
+
+
+def _column_widths(fieldnames: List[str], columns: List[list], cap: int = 50) -> List[int]:
+    """Width per column (longest value or header + 2, capped)"""
+    widths = []
+    for name, column in zip(fieldnames, columns):
+        longest = max((len(str(value)) for value in column if value is not None), default=0)
+        widths.append(min(max(longest, len(str(name))) + 2, cap))
+    return widths
+
+
+def _write_xlsxwriter_report(filepath: str, sheets: List[Tuple]) -> None:
+    """Write (name, fieldnames, columns, money_columns) sheets row by row with xlsxwriter"""
+    options = {
+        # Each row is flushed to disk once written, so memory stays flat
+        "constant_memory": True,
+        "strings_to_numbers": False,
+        "default_date_format": "yyyy-mm-dd",
+    }
+    with xlsxwriter.Workbook(filepath, options) as workbook:
+        header_format = workbook.add_format({"bold": True})
+        money_format = workbook.add_format({"num_format": _MONEY_FORMAT})
+        for name, fieldnames, columns, money_columns in sheets:
+            worksheet = workbook.add_worksheet(name)
+            # Rows can't be revisited in constant-memory mode: formats go first
+            for column, width in enumerate(_column_widths(fieldnames, columns)):
+                if column in money_columns:
+                    worksheet.set_column(column, column, 18, money_format)
+                else:
+                    worksheet.set_column(column, column, width)
+            worksheet.write_row(0, 0, fieldnames, header_format)
+            for row_number, row in enumerate(zip(*columns), start=1):
+                worksheet.write_row(row_number, 0, row)
+
+
+def _write_openpyxl_report(filepath: str, sheets: List[Tuple]) -> None:
+    """Write (name, fieldnames, columns, money_columns) sheets with a write-only workbook"""
+    # Write-only mode streams rows to the file instead of keeping Cell objects
+    workbook = Workbook(write_only=True)
+    for name, fieldnames, columns, money_columns in sheets:
+        worksheet = workbook.create_sheet(name)
+        for column, width in enumerate(_column_widths(fieldnames, columns)):
+            letter = get_column_letter(column + 1)
+            worksheet.column_dimensions[letter].width = 18 if column in money_columns else width
+
+        header = []
+        for fieldname in fieldnames:
+            cell = WriteOnlyCell(worksheet, value=fieldname)
+            cell.font = _HEADER_FONT
+            header.append(cell)
+        worksheet.append(header)
+
+        if not money_columns:
+            for row in zip(*columns):
+                worksheet.append(row)
+            continue
+        for row in zip(*columns):
+            row = list(row)
+            for column in money_columns:
+                cell = WriteOnlyCell(worksheet, value=row[column])
+                cell.number_format = _MONEY_FORMAT
+                row[column] = cell
+            worksheet.append(row)
+
+    workbook.save(filepath)
+
+
+def _ooxml_escape_char(match) -> str:
+    """_xHHHH_ for one control character; a literal underscore becomes _x005F_"""
+    return f"_x{ord(match.group()):04X}_"
+
+
+def _xml_text(value) -> str:
+    """Cell text escaped for XML, with control characters encoded the way Excel does"""
+    return escape(_OOXML_ESCAPE_RE.sub(_ooxml_escape_char, str(value)))
+
+
+def _raw_xlsx_cell(reference: str, value) -> str:
+    """One <c> element: finite numbers as values, everything else as inline text"""
+    kind = type(value)
+    if kind is int or (kind is float and math.isfinite(value)):
+        return f'<c r="{reference}"><v>{value}</v></c>'
+    if kind is Decimal and value.is_finite():
+        return f'<c r="{reference}"><v>{value}</v></c>'
+    if kind is bool:
+        return f'<c r="{reference}" t="b"><v>{int(value)}</v></c>'
+    # NaN and infinities have no numeric form in a sheet, so they are kept as text
+    text = _xml_text(value)
+    return f'<c r="{reference}" t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>'
+
+
+def _write_raw_xlsx(filepath: str, name: str, fieldnames: List[str], columns: List[list]):
+    """Write a single plain sheet by emitting the workbook XML directly"""
+    letters = [get_column_letter(column + 1) for column in range(len(fieldnames))]
+    with zipfile.ZipFile(filepath, "w", zipfile.ZIP_DEFLATED) as archive:
+        for part, xml in _RAW_XLSX_PARTS.items():
+            archive.writestr(part, _XML_DECLARATION + xml)
+        archive.writestr(
+            "xl/workbook.xml", _XML_DECLARATION + _RAW_WORKBOOK_XML.format(name=escape(name))
         )
-        filepath = self.export_dir / filename
-
-        with pd.ExcelWriter(filepath, engine="openpyxl") as writer:
-            summary_data = {
-                "Metric": [
-                    "Month-Year",
-                    "Total Expenses",
-                    "Number of Transactions",
-                    "Categories Covered",
-                ],
-                "Value": [
-                    f"{monthly_data['month']:02d}/{monthly_data['year']}",
-                    f"Rp {monthly_data['total_expenses']:,.0f}",
-                    len(expenses),
-                    len(monthly_data["category_breakdown"]),
-                ],
-            }
-            summary_df = pd.DataFrame(summary_data)
-            summary_df.to_excel(writer, sheet_name="Summary", index=False)
 
-        return str(filepath)
+        with archive.open("xl/worksheets/sheet1.xml", "w") as raw, io.TextIOWrapper(
+            io.BufferedWriter(raw, _CSV_BUFFER_SIZE), encoding="utf-8"
+        ) as sheet:
+            sheet.write(_XML_DECLARATION)
+            sheet.write(
+                '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+            )
+            if fieldnames:
+                sheet.write("<cols>")
+                for column, width in enumerate(_column_widths(fieldnames, columns), start=1):
+                    sheet.write(
+                        f'<col min="{column}" max="{column}" width="{width}" customWidth="1"/>'
+                    )
+                sheet.write("</cols>")
+            sheet.write('<sheetData><row r="1">')
+            for letter, fieldname in zip(letters, fieldnames):
+                text = _xml_text(fieldname)
+                sheet.write(
+                    f'<c r="{letter}1" s="1" t="inlineStr"><is><t>{text}</t></is></c>'
+                )
+            sheet.write("</row>")
+            for row_number, row in enumerate(zip(*columns), start=2):
+                cells = "".join(
+                    _raw_xlsx_cell(f"{letter}{row_number}", value)
+                    for letter, value in zip(letters, row)
+                    if value is not None
+                )
+                sheet.write(f'<row r="{row_number}">{cells}</row>')
+            sheet.write("</sheetData></worksheet>")
+
+
+def _write_workbook(filepath: str, sheets: List[Tuple]) -> None:
+    """Write sheets with xlsxwriter when installed, else openpyxl in write-only mode"""
+    if _EXCEL_ENGINE == "xlsxwriter":
+        _write_xlsxwriter_report(filepath, sheets)
+    else:
+        _write_openpyxl_report(filepath, sheets)
 
-# services/export_service.py
-from typing import Dict, List
 
 class ExportService:
     def __init__(self):
-        self.export_dir = Path(__file__).parent.parent / "exports"
-        self.export_dir.mkdir(exist_ok=True)
-
-    def export_to_csv(self, expenses: List[Dict], filename: str = None) -> str:
+        export_dir = os.environ.get("EXPENSE_EXPORT_DIR")
+        self.export_dir = Path(export_dir) if export_dir else _DEFAULT_EXPORT_DIR
+        self.export_dir.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def export_dir(self) -> Path:
+        """Directory export files are written to"""
+        return self._export_dir
+
+    @export_dir.setter
+    def export_dir(self, path) -> None:
+        self._export_dir = Path(path)
+        # Joined with plain string concatenation on every export
+        self._export_prefix = os.path.join(os.fspath(path), "")
+
+    def export_to_csv(
+        self, expenses: List[Dict], filename: str = None, sort_fieldnames: bool = False
+    ) -> str:
         """Export data to CSV"""
         if not filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = _timestamp()
             filename = f"expenses_export_{timestamp}.csv"
 
-        filepath = self.export_dir / filename
-
-        with open(filepath, "w", newline="", encoding="utf-8") as csvfile:
-            if expenses:
-                fieldnames = expenses[0].keys()
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(expenses)
-
-        return str(filepath)
+        filepath = self._export_prefix + filename
+
+        first_keys = expenses[0].keys() if expenses else ()
+        same_keys = bool(expenses) and all(e.keys() == first_keys for e in expenses)
+        if same_keys:
+            fieldnames = list(first_keys)
+        else:
+            # Union of keys in first-seen order
+            fieldnames = list(dict.fromkeys(key for expense in expenses for key in expense))
+        if sort_fieldnames:
+            fieldnames.sort()
+
+        with _atomic_output(filepath) as temp_path:
+            # csv.writer quotes an empty lone field; polars would write a blank line
+            if (
+                _HAS_POLARS
+                and same_keys
+                and len(fieldnames) > 1
+                and len(expenses) >= _POLARS_MIN_ROWS
+            ):
+                # Values are rendered as csv.writer would, so polars only quotes and writes
+                frame = pl.DataFrame(
+                    {name: list(map(_csv_text, _column(expenses, name))) for name in fieldnames},
+                    schema={name: pl.String for name in fieldnames},
+                )
+                frame.write_csv(temp_path, line_terminator="\r\n")
+                return filepath
+
+            with open(
+                temp_path, "w", newline="", encoding="utf-8", buffering=_CSV_BUFFER_SIZE
+            ) as csvfile:
+                if expenses:
+                    writer = csv.writer(csvfile)
+                    writer.writerow(fieldnames)
+                    if len(fieldnames) > 1 and same_keys:
+                        # Same keys everywhere (rows from one query): build tuples in C
+                        writer.writerows(map(itemgetter(*fieldnames), expenses))
+                    else:
+                        writer.writerows(
+                            [expense.get(name, "") for name in fieldnames] for expense in expenses
+                        )
+
+        return filepath
 
     def export_to_excel(self, expenses: List[Dict], filename: str = None) -> str:
         """Export data to Excel"""
         if not filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = _timestamp()
             filename = f"expenses_export_{timestamp}.xlsx"
 
-        filepath = self.export_dir / filename
-
-        # Convert to DataFrame
-        df = pd.DataFrame(expenses)
+        filepath = self._export_prefix + filename
 
-        # Format date columns
-        if "date" in df.columns:
-            df["date"] = pd.to_datetime(df["date"]).dt.strftime("%Y-%m-%d")
-
-        # Export to Excel
-        with pd.ExcelWriter(filepath, engine="openpyxl") as writer:
-            df.to_excel(writer, sheet_name="Expenses", index=False)
-
-            # Auto-adjust column widths
-            worksheet = writer.sheets["Expenses"]
-            for column in worksheet.columns:
-                max_length = 0
-                column_letter = column[0].column_letter
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                adjusted_width = max_length + 2
-                worksheet.column_dimensions[column_letter].width = adjusted_width
-
-        return str(filepath)
+        fieldnames, columns = _to_columnar(expenses)
+        with _atomic_output(filepath) as temp_path:
+            if len(expenses) >= _RAW_XLSX_MIN_ROWS:
+                # Plain values only: skip the per-cell work of the Excel libraries
+                _write_raw_xlsx(temp_path, "Expenses", fieldnames, columns)
+            else:
+                _write_workbook(temp_path, [("Expenses", fieldnames, columns, ())])
+        return filepath
 
     def export_monthly_report(self, monthly_data: Dict, expenses: List[Dict]) -> str:
         """Export comprehensive monthly report"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = _timestamp()
         filename = f"monthly_report_{monthly_data['year']}_{monthly_data['month']}_{timestamp}.xlsx"
-        filepath = self.export_dir / filename
-
-        with pd.ExcelWriter(filepath, engine="openpyxl") as writer:
-            # Sheet 1: Summary
-            summary_data = {
-                "Bulan": [f"{monthly_data['month']}/{monthly_data['year']}"],
-                "Total Pengeluaran": [monthly_data["total_expenses"]],
-                "Jumlah Transaksi": [len(expenses)],
-            }
-            summary_df = pd.DataFrame(summary_data)
-            summary_df.to_excel(writer, sheet_name="Ringkasan", index=False)
-
-            # Sheet 2: Category Breakdown
-            if "category_breakdown" in monthly_data:
-                category_df = pd.DataFrame(monthly_data["category_breakdown"])
-                category_df.to_excel(writer, sheet_name="Per Kategori", index=False)
-
-            # Sheet 3: Transaction Details
-            expenses_df = pd.DataFrame(expenses)
-            if "date" in expenses_df.columns:
-                expenses_df["date"] = pd.to_datetime(expenses_df["date"]).dt.strftime("%Y-%m-%d")
-            expenses_df.to_excel(writer, sheet_name="Detail Transaksi", index=False)
-
-        return str(filepath)
+        filepath = self._export_prefix + filename
+
+        sheets = self._monthly_report_sheets(monthly_data, expenses)
+        with _atomic_output(filepath) as temp_path:
+            _write_workbook(temp_path, sheets)
+        return filepath
+
+    @staticmethod
+    def _monthly_report_sheets(monthly_data: Dict, expenses: List[Dict]) -> List[Tuple]:
+        """Summary, per-category and detail sheets for a monthly report"""
+        sheets = [
+            (
+                "Ringkasan",
+                ["Bulan", "Total Pengeluaran", "Jumlah Transaksi"],
+                [
+                    [f"{monthly_data['month']}/{monthly_data['year']}"],
+                    [monthly_data["total_expenses"]],
+                    [len(expenses)],
+                ],
+                (1,),
+            )
+        ]
+
+        if "category_breakdown" in monthly_data:
+            fieldnames, columns = _to_columnar(monthly_data["category_breakdown"])
+            money_columns = (fieldnames.index("total"),) if "total" in fieldnames else ()
+            sheets.append(("Per Kategori", fieldnames, columns, money_columns))
+
+        fieldnames, columns = _to_columnar(expenses)
+        if "date" in fieldnames:
+            # Real dates, shown with the workbook's default date format
+            date_index = fieldnames.index("date")
+            columns[date_index] = list(map(_report_date, columns[date_index]))
+        sheets.append(("Detail Transaksi", fieldnames, columns, ()))
+        return sheets
@@ -26,55 +26,48 @@ def print_tree(start_path=".", max_depth=None, show_hidden=False):
             return True
         return False
 
-    def print_item(path, prefix, is_last):
-        """Print a single item with proper prefix"""
-        name = os.path.basename(path)
-
-        # Skip hidden/system directories
-        if should_skip(name):
-            return
-
-        # Choose connector
-        if is_last:
-            connector = "└── "
-            next_prefix = prefix + "    "
-        else:
-            connector = "├── "
-            next_prefix = prefix + "│   "
-
-        # Check if it's a directory or file
-        if os.path.isdir(path):
-            print(f"{prefix}{connector}{name}/")
-            return next_prefix, True
-        else:
-            print(f"{prefix}{connector}{name}")
-            return next_prefix, False
-
-    def walk_directory(current_path, prefix="", depth=0):
-        """Recursively walk through directory"""
-        if max_depth is not None and depth > max_depth:
-            return
-
+    def list_entries(current_path, prefix):
+        """Directory entries of a folder, directories first"""
         try:
-            items = os.listdir(current_path)
+            with os.scandir(current_path) as it:
+                entries = [entry for entry in it if not should_skip(entry.name)]
         except PermissionError:
             print(f"{prefix}└── [Permission Denied]")
-            return
-
-        # Filter and sort items
-        items = [item for item in items if not should_skip(item)]
-        items.sort(key=lambda x: (not os.path.isdir(os.path.join(current_path, x)), x.lower()))
+            return []
 
-        # Print all items
-        for i, item in enumerate(items):
-            full_path = os.path.join(current_path, item)
-            is_last = i == len(items) - 1
+        # is_dir() reuses the type read with the directory, no extra stat
+        entries.sort(key=lambda e: (not e.is_dir(follow_symlinks=False), e.name.lower()))
+        return entries
 
-            next_prefix, is_dir = print_item(full_path, prefix, is_last)
-
-            # Recursively process directories
-            if is_dir:
-                walk_directory(full_path, next_prefix, depth + 1)
+    def push_children(stack, current_path, prefix, depth):
+        """Queue a folder's entries so they pop in display order"""
+        if max_depth is not None and depth > max_depth:
+            return
+        entries = list_entries(current_path, prefix)
+        last = len(entries) - 1
+        for i in range(last, -1, -1):
+            stack.append((entries[i], prefix, i == last, depth))
+
+    def walk_directory(current_path):
+        """Walk through the directory tree with an explicit stack"""
+        stack = []
+        push_children(stack, current_path, "", 0)
+        while stack:
+            entry, prefix, is_last, depth = stack.pop()
+
+            # Choose connector
+            if is_last:
+                connector = "└── "
+                next_prefix = prefix + "    "
+            else:
+                connector = "├── "
+                next_prefix = prefix + "│   "
+
+            if entry.is_dir(follow_symlinks=False):
+                print(f"{prefix}{connector}{entry.name}/")
+                push_children(stack, entry.path, next_prefix, depth + 1)
+            else:
+                print(f"{prefix}{connector}{entry.name}")
 
     print(f"\n📁 Directory Tree: {os.path.basename(start_path)}/")
     print("─" * 50)
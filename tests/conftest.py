@@ -4,63 +4,71 @@
 Pytest configuration and fixtures for expense tracker tests
 """
 
+import importlib
 import tempfile
 import os
 import sys
 from pathlib import Path
 import pytest
 
+# Headless backend: no GUI toolkit is probed when matplotlib is imported
+os.environ.setdefault("MPLBACKEND", "Agg")
+
 # Add project root to Python path for imports
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+# Application modules imported once up front by _warm_imports
+APP_MODULES = (
+    "config.database_config",
+    "services.database_service",
+    "services.expense_service",
+    "services.export_service",
+    "visualization.chart_service",
+)
 
-@pytest.fixture
-def clean_exports_dir():
-    """Clean exports directory before test"""
-    exports_dir = Path("exports")
-    exports_dir.mkdir(exist_ok=True)
-    
-    # Remove any test files
-    for file in exports_dir.glob("test_*.csv"):
-        try:
-            file.unlink()
-        except:
-            pass
-    for file in exports_dir.glob("test_*.xlsx"):
-        try:
-            file.unlink()
-        except:
-            pass
-    yield exports_dir
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_imports():
+    """Import the application modules (and matplotlib) once, before the first test"""
+    for name in APP_MODULES:
+        importlib.import_module(name)
 
 
 @pytest.fixture
-def expense_service_fixture():
-    """Create ExpenseService fixture with in-memory database"""
-    from services.expense_service import ExpenseService
+def clean_exports_dir(export_service_fixture, tmp_path, monkeypatch):
+    """Point the shared ExportService at a fresh per-test directory"""
+    # pytest creates and prunes tmp_path, so tests need no cleanup of their own
+    monkeypatch.setattr(export_service_fixture, "export_dir", tmp_path)
+    yield tmp_path
+
+
+@pytest.fixture(scope="session")
+def db_service():
+    """One in-memory DatabaseService, created and initialized once per test session"""
     from services.database_service import DatabaseService
-    
-    # Create an in-memory database service
-    db_service = DatabaseService(":memory:")
-    
-    # Create expense service
-    service = ExpenseService()
-    # Replace the internal db_service with our in-memory one
-    service.db_service = db_service
-    
+
+    service = DatabaseService(":memory:")
     yield service
+    service.close()
+
+
+@pytest.fixture(scope="session")
+def expense_service_fixture(db_service):
+    """Create one ExpenseService for the session, backed by the shared in-memory database"""
+    from services.expense_service import ExpenseService
     
-    # Cleanup - close database connection
-    if hasattr(db_service, 'close'):
-        db_service.close()
+    # Passed in, so the default data/expenses.db is never opened
+    service = ExpenseService(db_service)
+    yield service
 
 
-@pytest.fixture
-def export_service_fixture(clean_exports_dir):
-    """Create ExportService fixture"""
+@pytest.fixture(scope="session")
+def export_service_fixture(tmp_path_factory):
+    """Create one ExportService for the session, exporting into a temp directory"""
     from services.export_service import ExportService
     service = ExportService()
+    service.export_dir = tmp_path_factory.mktemp("exports")
     yield service
 
 
@@ -0,0 +1,33 @@
+# tests/test_charts.py
+
+"""
+Unit tests for the chart service
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from visualization.chart_service import ChartService, _set3_colors
+
+
+def test_set3_colors_is_read_only():
+    """The cached palette can't be changed in place by one caller for all the others"""
+    colors = _set3_colors(3)
+    with pytest.raises(ValueError):
+        colors[0, 0] = 0.123
+    assert np.array_equal(_set3_colors(3), colors)
+
+
+def test_pie_chart_uses_cached_palette(tmp_path):
+    """A pie chart renders with the shared read-only palette"""
+    service = ChartService()
+    service.output_dir = tmp_path
+    category_data = [
+        {"category": "Belanja", "total": 50000},
+        {"category": "Hiburan", "total": 25000},
+    ]
+    path = Path(service.generate_pie_chart(category_data, 2024, 1))
+    assert path.parent == tmp_path
+    assert path.stat().st_size > 0
@@ -4,344 +4,209 @@
 Unit tests for database service and models
 """
 
-# services/database_service.py
-"""
-Database Service - Fixed Version
-"""
-
 import sqlite3
-import os
 from datetime import date
 from decimal import Decimal
-from typing import List, Optional, Dict, Any
-
-
-class DatabaseService:
-    def __init__(self, db_name: str = "expenses.db"):
-        """Initialize database service"""
-        # Create data directory if it doesn't exist
-        data_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data")
-        os.makedirs(data_dir, exist_ok=True)
-        
-        self.db_path = os.path.join(data_dir, db_name)
-        self._initialize_database()
-    
-    def _initialize_database(self):
-        """Initialize database tables"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        # Create expenses table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS expenses (
+
+import pytest
+
+from config.database_config import DatabaseConfig
+from models.expense_model import Expense
+from services.database_service import DatabaseService, ExpenseRow
+
+
+@pytest.fixture
+def db():
+    """Fresh in-memory database for tests that check exact totals"""
+    service = DatabaseService(":memory:")
+    yield service
+    service.close()
+
+
+def test_default_categories_are_seeded(db):
+    """Initialization creates the default categories once"""
+    names = [category["name"] for category in db.get_all_categories()]
+    assert len(names) == 8
+    assert "Makanan & Minuman" in names
+    db.initialize_database()
+    assert len(db.get_categories()) == 8
+
+
+def test_add_expense_round_trips_amounts(db):
+    """Amounts are stored as cents and come back as ints or floats"""
+    whole_id = db.add_expense(
+        Expense(date=date(2024, 1, 15), category="Belanja", amount=Decimal("50000"))
+    )
+    cents_id = db.add_expense(
+        {"date": "2024-01-16", "category": "Belanja", "amount": "12.34", "description": "x"}
+    )
+
+    whole = db.get_expense_by_id(whole_id)
+    assert whole["date"] == "2024-01-15"
+    assert whole["amount"] == 50000 and isinstance(whole["amount"], int)
+    assert db.get_expense_by_id(cents_id)["amount"] == 12.34
+    assert db.get_expense_by_id(999) is None
+
+
+def test_add_batch_expenses_returns_ids_in_order(db):
+    """Batch inserts return one ID per row, in input order"""
+    rows = [
+        {"date": f"2024-02-0{day}", "category": "Transportasi", "amount": day * 1000}
+        for day in range(1, 6)
+    ]
+    ids = db.add_batch_expenses(rows)
+    assert len(ids) == 5
+    assert [db.get_expense_by_id(i)["amount"] for i in ids] == [1000, 2000, 3000, 4000, 5000]
+    assert db.add_batch_expenses([]) == []
+
+
+def test_get_expenses_filters_and_orders(db):
+    """Month, year and category filters use date ranges; newest first"""
+    db.add_batch_expenses(
+        [
+            {"date": "2024-01-31", "category": "Belanja", "amount": 1},
+            {"date": "2024-02-01", "category": "Belanja", "amount": 2},
+            {"date": "2024-02-15", "category": "Hiburan", "amount": 3},
+            {"date": "2023-12-31", "category": "Belanja", "amount": 4},
+        ]
+    )
+
+    february = db.get_expenses(month=2, year=2024)
+    assert [e["date"] for e in february] == ["2024-02-15", "2024-02-01"]
+    assert len(db.get_expenses(year=2024)) == 3
+    assert len(db.get_expenses(year=2024, category="Belanja")) == 2
+    assert len(db.get_expenses(limit=2)) == 2
+    assert [row.amount for row in db.iter_expense_rows(month=1, year=2024)] == [1]
+    assert isinstance(next(db.iter_expense_rows()), ExpenseRow)
+
+    in_range = db.get_expenses_by_date_range(date(2024, 1, 31), "2024-02-15")
+    assert [e["amount"] for e in in_range] == [3, 2, 1]
+    belanja = db.get_expenses_by_date_range("2023-12-31", "2024-02-01", "Belanja")
+    assert [e["amount"] for e in belanja] == [2, 1, 4]
+    rows = db.get_expenses_by_date_range("2024-02-01", "2024-02-29", as_rows=True)
+    assert [(row.category, row.amount) for row in rows] == [("Hiburan", 3), ("Belanja", 2)]
+
+
+def test_monthly_summary_tracks_writes(db):
+    """Summaries reflect inserts, updates and deletes despite caching"""
+    first = db.add_expense({"date": "2024-03-01", "category": "Belanja", "amount": 75})
+    db.add_expense({"date": "2024-03-02", "category": "Hiburan", "amount": 25})
+
+    summary = db.get_monthly_summary(2024, 3)
+    assert summary["total_expenses"] == 100
+    assert summary["transaction_count"] == 2
+    assert summary["category_breakdown"][0] == {
+        "category": "Belanja",
+        "total": 75,
+        "percentage": 75.0,
+    }
+
+    assert db.update_expense(first, {"date": "2024-04-01", "category": "Belanja", "amount": 75})
+    assert db.get_monthly_summary(2024, 3)["total_expenses"] == 25
+    assert db.delete_expense(first)
+    assert not db.delete_expense(first)
+    assert db.get_monthly_summary(2024, 4)["total_expenses"] == 0
+
+
+def test_yearly_summary(db):
+    """Yearly totals are the sum of a twelve-month breakdown"""
+    db.add_batch_expenses(
+        [
+            {"date": "2024-01-10", "category": "Belanja", "amount": 10},
+            {"date": "2024-01-11", "category": "Belanja", "amount": 5},
+            {"date": "2024-06-01", "category": "Tagihan", "amount": 20},
+            {"date": "2025-01-01", "category": "Tagihan", "amount": 99},
+        ]
+    )
+
+    summary = db.get_yearly_summary(2024)
+    assert summary["total_expenses"] == 35
+    assert summary["transaction_count"] == 3
+    breakdown = summary["monthly_breakdown"]
+    assert [m["month"] for m in breakdown] == [f"{month:02d}" for month in range(1, 13)]
+    assert [(m["month"], m["total"], m["count"]) for m in breakdown if m["count"]] == [
+        ("01", 15, 2),
+        ("06", 20, 1),
+    ]
+    assert db.get_yearly_summary(2030)["monthly_breakdown"][11] == {
+        "month": "12",
+        "total": 0,
+        "count": 0,
+    }
+
+
+def test_decimal_amounts_migrate_with_columns_and_constraints(tmp_path):
+    """The cents migration keeps the legacy table's extra columns and CHECK constraints"""
+    db_path = str(tmp_path / "legacy.db")
+    with sqlite3.connect(db_path) as legacy:
+        legacy.execute(
+            """
+            CREATE TABLE expenses (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 date DATE NOT NULL,
                 category VARCHAR(50) NOT NULL,
-                amount DECIMAL(10,2) NOT NULL,
+                amount DECIMAL(10,2) NOT NULL CHECK (amount >= 0),
                 description TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-        
-        # Create categories table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS categories (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name VARCHAR(50) UNIQUE NOT NULL,
-                budget_limit DECIMAL(10,2) DEFAULT NULL,
-                description TEXT
-            )
-        """)
-        
-        # Insert default categories
-        default_categories = [
-            ('Makanan & Minuman', None, 'Pengeluaran untuk makanan dan minuman'),
-            ('Transportasi', None, 'Biaya transportasi'),
-            ('Belanja', None, 'Belanja kebutuhan sehari-hari'),
-            ('Hiburan', None, 'Pengeluaran hiburan dan rekreasi'),
-            ('Kesehatan', None, 'Biaya kesehatan dan obat-obatan'),
-            ('Pendidikan', None, 'Biaya pendidikan dan kursus'),
-            ('Tagihan', None, 'Pembayaran tagihan rutin'),
-            ('Lain-lain', None, 'Pengeluaran lainnya'),
-        ]
-        
-        for category_name, budget_limit, description in default_categories:
-            cursor.execute(
-                "INSERT OR IGNORE INTO categories (name, budget_limit, description) VALUES (?, ?, ?)",
-                (category_name, budget_limit, description)
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )
-        
-        conn.commit()
-        conn.close()
-    
-    def get_connection(self):
-        """Get database connection"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        return conn
-    
-    def add_expense(self, expense) -> int:
-        """Add new expense to database"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        # Convert date to string if it's a date object
-        if isinstance(expense.date, date):
-            date_str = expense.date.isoformat()
-        else:
-            date_str = expense.date
-        
-        # Convert amount to float if it's a Decimal
-        if isinstance(expense.amount, Decimal):
-            amount_float = float(expense.amount)
-        else:
-            amount_float = expense.amount
-        
-        cursor.execute(
-            """
-            INSERT INTO expenses (date, category, amount, description)
-            VALUES (?, ?, ?, ?)
-            """,
-            (date_str, expense.category, amount_float, expense.description),
-        )
-        expense_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
-        return expense_id
-    
-    def get_expense(self, expense_id: int):
-        """Get expense by ID"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM expenses WHERE id = ?", (expense_id,))
-        row = cursor.fetchone()
-        conn.close()
-        if row:
-            return dict(row)
-        return None
-    
-    def get_all_expenses(self, limit=None, offset=None):
-        """Get all expenses with optional pagination"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        query = "SELECT * FROM expenses ORDER BY date DESC, created_at DESC"
-        params = []
-        if limit is not None:
-            query += " LIMIT ?"
-            params.append(limit)
-            if offset is not None:
-                query += " OFFSET ?"
-                params.append(offset)
-        cursor.execute(query, params)
-        expenses = [dict(row) for row in cursor.fetchall()]
-        conn.close()
-        return expenses
-    
-    def get_expenses(
-        self,
-        month: Optional[int] = None,
-        year: Optional[int] = None,
-        category: Optional[str] = None,
-    ):
-        """Get expenses with optional filters"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        query = "SELECT * FROM expenses WHERE 1=1"
-        params = []
-        if month and year:
-            query += " AND strftime('%Y', date) = ? AND strftime('%m', date) = ?"
-            params.extend([str(year), f"{month:02d}"])
-        elif year:
-            query += " AND strftime('%Y', date) = ?"
-            params.append(str(year))
-        if category:
-            query += " AND category = ?"
-            params.append(category)
-        query += " ORDER BY date DESC, created_at DESC"
-        cursor.execute(query, params)
-        expenses = [dict(row) for row in cursor.fetchall()]
-        conn.close()
-        return expenses
-    
-    def get_expenses_by_category(self, category: str):
-        """Get expenses by category"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            SELECT * FROM expenses
-            WHERE category = ?
-            ORDER BY date DESC, created_at DESC
-            """,
-            (category,),
-        )
-        expenses = [dict(row) for row in cursor.fetchall()]
-        conn.close()
-        return expenses
-    
-    def get_expenses_by_month(self, year: int, month: int):
-        """Get expenses by month"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            SELECT * FROM expenses
-            WHERE strftime('%Y', date) = ? AND strftime('%m', date) = ?
-            ORDER BY date DESC, created_at DESC
-            """,
-            (str(year), f"{month:02d}"),
-        )
-        expenses = [dict(row) for row in cursor.fetchall()]
-        conn.close()
-        return expenses
-    
-    def update_expense(self, expense_id: int, expense):
-        """Update existing expense"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        # Convert date
-        if isinstance(expense.date, date):
-            date_str = expense.date.isoformat()
-        else:
-            date_str = expense.date
-        
-        # Convert amount
-        if isinstance(expense.amount, Decimal):
-            amount_float = float(expense.amount)
-        else:
-            amount_float = expense.amount
-        
-        cursor.execute(
             """
-            UPDATE expenses
-            SET date = ?, category = ?, amount = ?, description = ?
-            WHERE id = ?
-            """,
-            (date_str, expense.category, amount_float, expense.description, expense_id),
         )
-        rows_affected = cursor.rowcount
-        conn.commit()
-        conn.close()
-        return rows_affected > 0
-    
-    def delete_expense(self, expense_id: int):
-        """Delete expense"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM expenses WHERE id = ?", (expense_id,))
-        rows_affected = cursor.rowcount
-        conn.commit()
-        conn.close()
-        return rows_affected > 0
-    
-    def get_all_categories(self):
-        """Get all categories"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM categories ORDER BY name")
-        categories = [dict(row) for row in cursor.fetchall()]
-        conn.close()
-        return categories
-    
-    def get_categories(self):
-        """Get all categories (alias for get_all_categories)"""
-        return self.get_all_categories()
-    
-    def get_monthly_summary(self, year: int, month: int):
-        """Get monthly expense summary"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        # Get total expenses
-        cursor.execute(
-            """
-            SELECT COALESCE(SUM(amount), 0) as total
-            FROM expenses
-            WHERE strftime('%Y', date) = ? AND strftime('%m', date) = ?
-            """,
-            (str(year), f"{month:02d}"),
-        )
-        total_row = cursor.fetchone()
-        total = total_row["total"] if total_row else 0
-        
-        # Get breakdown by category
-        cursor.execute(
-            """
-            SELECT category, SUM(amount) as total
-            FROM expenses
-            WHERE strftime('%Y', date) = ? AND strftime('%m', date) = ?
-            GROUP BY category
-            ORDER BY total DESC
-            """,
-            (str(year), f"{month:02d}"),
+        legacy.execute(
+            "INSERT INTO expenses (date, category, amount, description, updated_at) "
+            "VALUES ('2024-01-15', 'Belanja', 12.34, 'x', '2024-01-16 08:00:00')"
         )
-        by_category = [dict(row) for row in cursor.fetchall()]
-        
-        conn.close()
-        return {
-            "year": year,
-            "month": month,
-            "total_expenses": total,
-            "category_breakdown": by_category,
-        }
-    
-    def get_yearly_summary(self, year: int):
-        """Get yearly expense summary"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        # Get yearly total and count
-        cursor.execute(
-            """
-            SELECT COALESCE(SUM(amount), 0) as total, COUNT(*) as count
-            FROM expenses
-            WHERE strftime('%Y', date) = ?
-            """,
-            (str(year),),
+    legacy.close()
+
+    db = DatabaseService(db_path)
+    columns = {row[1]: row[2] for row in db.get_connection().execute("PRAGMA table_info(expenses)")}
+    assert columns["amount"] == "INTEGER"
+    assert "updated_at" in columns
+    assert db.get_expenses()[0]["amount"] == 12.34
+    with pytest.raises(sqlite3.IntegrityError):
+        db.add_expense({"date": "2024-01-16", "category": "Belanja", "amount": -1})
+    db.close()
+
+    with sqlite3.connect(db_path) as check:
+        assert check.execute("SELECT updated_at FROM expenses").fetchone() == (
+            "2024-01-16 08:00:00",
         )
-        year_row = cursor.fetchone()
-        total = year_row["total"] if year_row else 0
-        count = year_row["count"] if year_row else 0
-        
-        conn.close()
-        return {
-            "year": year,
-            "total_expenses": total,
-            "transaction_count": count,
-        }
-
-
-# Simple test to verify the class works
-if __name__ == "__main__":
-    print("Testing DatabaseService...")
-    service = DatabaseService()
-    
-    # Test categories
-    categories = service.get_categories()
-    print(f"Found {len(categories)} categories")
-    
-    # Test creating a simple expense
-    class SimpleExpense:
-        def __init__(self):
-            self.date = date.today()
-            self.category = "Test"
-            self.amount = Decimal("10000")
-            self.description = "Test expense"
-    
-    try:
-        expense_id = service.add_expense(SimpleExpense())
-        print(f"Added test expense with ID: {expense_id}")
-        
-        # Get it back
-        expense = service.get_expense(expense_id)
-        if expense:
-            print(f"Retrieved expense: {expense['description']}")
-        
-        # Delete it
-        if service.delete_expense(expense_id):
-            print(f"Deleted test expense")
-    except Exception as e:
-        print(f"Error: {e}")
-    
-    print("DatabaseService test complete!")
\ No newline at end of file
+    check.close()
+
+
+def test_interrupted_write_transaction_rolls_back(db):
+    """An interrupt inside a write leaves the connection usable for later writes"""
+    with pytest.raises(KeyboardInterrupt):
+        with db._write_transaction() as conn:
+            conn.execute("INSERT INTO categories (name) VALUES (?)", ("Interrupted",))
+            raise KeyboardInterrupt
+    assert "Interrupted" not in [category["name"] for category in db.get_all_categories()]
+    assert db.add_expense(
+        {"date": "2024-01-15", "category": "Belanja", "amount": "1000", "description": ""}
+    )
+
+
+def test_database_config_creates_the_service_schema(tmp_path):
+    """DatabaseConfig and DatabaseService build the same tables, indexes and seed rows"""
+    config = DatabaseConfig(str(tmp_path / "config.db"))
+    assert config.initialize_database()
+    config.close()
+    DatabaseService(str(tmp_path / "service.db")).close()
+
+    def snapshot(path):
+        conn = sqlite3.connect(path)
+        try:
+            return (
+                conn.execute(
+                    "SELECT type, name, sql FROM sqlite_master "
+                    "WHERE name NOT LIKE 'sqlite_%' ORDER BY name"
+                ).fetchall(),
+                conn.execute("PRAGMA user_version").fetchone(),
+                conn.execute(
+                    "SELECT name, budget_limit, description FROM categories ORDER BY name"
+                ).fetchall(),
+            )
+        finally:
+            conn.close()
+
+    assert snapshot(tmp_path / "config.db") == snapshot(tmp_path / "service.db")
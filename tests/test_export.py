@@ -3,13 +3,20 @@
 """
 Integration tests for export functionality
 """
+import logging
 import tempfile
+import threading
+from decimal import Decimal
 from pathlib import Path
 
 import pytest
+from openpyxl import load_workbook
 
+import services.export_service as export_service
 from services.export_service import ExportService
 
+logger = logging.getLogger(__name__)
+
 def test_export_service_integration():
     """Integration test for ExportService"""
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -50,10 +57,10 @@ def test_export_service_integration():
         report_path = service.export_monthly_report(monthly_data, sample_expenses)
         assert Path(report_path).exists()
         assert report_path.endswith(".xlsx")
-        print("✅ All exports created successfully")
-        print(f"   CSV: {csv_path}")
-        print(f"   Excel: {excel_path}")
-        print(f"   Report: {report_path}")
+        logger.debug("✅ All exports created successfully")
+        logger.debug("   CSV: %s", csv_path)
+        logger.debug("   Excel: %s", excel_path)
+        logger.debug("   Report: %s", report_path)
 
 def test_export_service_instantiation():
     """Test that ExportService can be instantiated and has required methods"""
@@ -66,3 +73,127 @@ def test_export_service_instantiation():
     assert callable(service.export_to_csv)
     assert callable(service.export_to_excel)
     assert callable(service.export_monthly_report)
+
+
+def test_export_to_csv_fieldname_order(tmp_path):
+    """CSV header keeps first-seen key order unless sorting is requested"""
+    service = ExportService()
+    service.export_dir = tmp_path
+    expenses = [
+        {"date": "2024-01-15", "amount": 50000},
+        {"date": "2024-01-16", "category": "Transport"},
+    ]
+    csv_path = service.export_to_csv(expenses, "ordered.csv")
+    assert Path(csv_path).read_text(encoding="utf-8").splitlines() == [
+        "date,amount,category",
+        "2024-01-15,50000,",
+        "2024-01-16,,Transport",
+    ]
+    sorted_path = service.export_to_csv(expenses, "sorted.csv", sort_fieldnames=True)
+    assert Path(sorted_path).read_text(encoding="utf-8").splitlines()[0] == "amount,category,date"
+
+
+def test_export_to_excel_raw_xml_matches_library_writer(tmp_path, monkeypatch):
+    """Large exports written as raw sheet XML read back like the regular workbook"""
+    service = ExportService()
+    service.export_dir = tmp_path
+    expenses = [
+        {"date": "2024-01-15", "category": "Food & <Drinks>", "amount": 50000, "description": None},
+        {"date": "2024-01-16", "category": "Transport", "amount": 2500.5, "description": " Bus"},
+    ]
+    regular = service.export_to_excel(expenses, "regular.xlsx")
+    monkeypatch.setattr(export_service, "_RAW_XLSX_MIN_ROWS", 1)
+    raw = service.export_to_excel(expenses, "raw.xlsx")
+
+    sheet = load_workbook(raw).active
+    assert sheet.title == "Expenses"
+    assert sheet["A1"].font.b
+    assert list(sheet.values) == list(load_workbook(regular).active.values)
+
+
+def test_export_to_excel_raw_xml_escapes_awkward_values(tmp_path):
+    """Control characters and non-finite amounts still give a readable large workbook"""
+    service = ExportService()
+    service.export_dir = tmp_path
+    awkward = [
+        {"date": "2024-01-01", "category": "Food", "amount": 1, "description": "bad\x01char"},
+        {"date": "2024-01-02", "category": "Food", "amount": 2, "description": "_x0041_ \r"},
+        {"date": "2024-01-03", "category": "Food", "amount": float("nan"), "description": ""},
+        {"date": "2024-01-04", "category": "Food", "amount": float("inf"), "description": ""},
+        {"date": "2024-01-05", "category": "Food", "amount": Decimal("-Infinity"), "description": ""},
+    ]
+    filler = {"date": "2024-01-06", "category": "Food", "amount": 10, "description": "x"}
+    expenses = awkward + [filler] * (export_service._RAW_XLSX_MIN_ROWS - len(awkward))
+
+    raw = service.export_to_excel(expenses, "raw.xlsx")
+    rows = list(load_workbook(raw, read_only=True).active.values)
+    assert len(rows) == len(expenses) + 1
+    assert [row[2] for row in rows[3:6]] == ["nan", "inf", "-Infinity"]
+    assert rows[-1] == ("2024-01-06", "Food", 10, "x")
+
+    assert rows[1][3] == "bad_x0001_char"
+    if export_service._EXCEL_ENGINE == "xlsxwriter":
+        # Text is encoded exactly as xlsxwriter encodes it (openpyxl rejects control characters)
+        regular = service.export_to_excel(awkward[:2], "regular.xlsx")
+        assert rows[1:3] == list(load_workbook(regular).active.values)[1:]
+
+
+def test_export_to_csv_polars_matches_csv_writer(tmp_path, monkeypatch):
+    """Large CSV exports written by polars are byte-identical to the csv.writer output"""
+    pytest.importorskip("polars")
+    service = ExportService()
+    service.export_dir = tmp_path
+    expenses = [
+        {
+            "date": "2024-01-15",
+            "category": "Food, Drinks",
+            "amount": 50000 if i % 2 else 2500.5,
+            "description": "" if i % 3 else 'say "hi"',
+            "note": None,
+        }
+        for i in range(export_service._POLARS_MIN_ROWS + 1000)
+    ]
+    fast = service.export_to_csv(expenses, "polars.csv")
+    monkeypatch.setattr(export_service, "_HAS_POLARS", False)
+    plain = service.export_to_csv(expenses, "plain.csv")
+
+    assert Path(fast).read_bytes() == Path(plain).read_bytes()
+
+
+def test_monthly_report_keeps_non_iso_dates(tmp_path):
+    """A date that isn't YYYY-MM-DD is written as text instead of aborting the report"""
+    service = ExportService()
+    service.export_dir = tmp_path
+    expenses = [
+        {"date": "2024-01-15", "category": "Food", "amount": 50000},
+        {"date": "15/01/2024", "category": "Food", "amount": 25000},
+    ]
+    monthly_data = {"year": 2024, "month": 1, "total_expenses": 75000}
+    report = load_workbook(service.export_monthly_report(monthly_data, expenses))
+
+    dates = [row[0] for row in report["Detail Transaksi"].iter_rows(min_row=2, values_only=True)]
+    assert dates[0].date().isoformat() == "2024-01-15"
+    assert dates[1] == "15/01/2024"
+
+
+def test_atomic_output_temp_paths_differ_per_thread(tmp_path):
+    """Two threads writing the same export get separate temporary files"""
+    target = str(tmp_path / "report.csv")
+    paths = []
+
+    def write(text):
+        with export_service._atomic_output(target) as temp_path:
+            paths.append(temp_path)
+            Path(temp_path).write_text(text)
+            barrier.wait()
+
+    barrier = threading.Barrier(2)
+    threads = [threading.Thread(target=write, args=(text,)) for text in ("a", "b")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert paths[0] != paths[1]
+    assert Path(target).read_text() in ("a", "b")
+    assert [path.name for path in tmp_path.iterdir()] == ["report.csv"]
@@ -0,0 +1,23 @@
+# tests/test_formatters.py
+
+"""
+Unit tests for the display formatters
+"""
+
+from decimal import Decimal
+
+from utils.formatters import _format_currency, format_currency
+
+
+def test_format_currency_groups_thousands():
+    """Amounts are rounded and grouped with dots"""
+    assert format_currency(Decimal("1234567")) == "Rp 1.234.567"
+    assert format_currency(50000) == "Rp 50.000"
+    assert format_currency(0.4) == "Rp 0"
+
+
+def test_format_currency_zero_ignores_call_history():
+    """Signed zeros format the same whichever was cached first"""
+    for first, second in ((0, -0.0), (-0.0, 0), (Decimal("-0"), Decimal("0"))):
+        _format_currency.cache_clear()
+        assert format_currency(first) == format_currency(second) == "Rp 0"
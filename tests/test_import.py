@@ -1,40 +1,33 @@
-# tests/test_export.py
+# tests/test_import.py
 """
 Test imports with proper path setup
 """
-import os
-import sys
+import importlib
+import logging
 
-# Add project root to Python path
-project_root = os.path.dirname(os.path.abspath(__file__))
-sys.path.insert(0, project_root)
+import pytest
 
-print("Testing imports with proper Python path...")
-print("=" * 50)
+logger = logging.getLogger(__name__)
 
-try:
-    from config.database_config import DatabaseConfig
-
-    print("✅ config.database_config.DatabaseConfig")
-    from services.expense_service import ExpenseService
 
-    print("✅ services.expense_service.ExpenseService")
-    from services.export_service import ExportService
+@pytest.mark.parametrize(
+    "module_name",
+    [
+        "config.database_config",
+        "services.expense_service",
+        "services.export_service",
+        "visualization.chart_service",
+    ],
+)
+def test_module_imports(module_name):
+    """Each application module imports cleanly"""
+    importlib.import_module(module_name)
+    logger.debug("✅ %s", module_name)
 
-    print("✅ services.export_service.ExportService")
-    from visualization.chart_service import ChartService
 
-    print("✅ visualization.chart_service.ChartService")
-    print("\n🎉 ALL IMPORTS WORKING!")
-    # Test database initialization
-    print("\n🧪 Testing database initialization...")
-    db = DatabaseConfig()
-    print("✅ DatabaseConfig instantiated")
-except ImportError as e:
-    print(f"\n❌ Import failed: {e}")
-    print(f"\nCurrent Python path: {sys.path}")
-except Exception as e:
-    print(f"\n⚠️  Other error: {e}")
+def test_database_config_instantiates():
+    """DatabaseConfig can be created without touching the database"""
+    from config.database_config import DatabaseConfig
 
-print("\n" + "=" * 50)
-print("✅ Project is 100% complete!")
+    assert DatabaseConfig().db_path.name == "expenses.db"
+    logger.debug("✅ DatabaseConfig instantiated")
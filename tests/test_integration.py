@@ -3,98 +3,99 @@
 Integration tests for export functionality
 """
 
+import importlib
+import logging
 import os
 import sys
-from pathlib import Path
+
+import pytest
 
 # Add the parent directory to sys.path to allow imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+# Progress messages; shown with --log-cli-level=DEBUG
+logger = logging.getLogger(__name__)
+
+
+# Modules the application needs; checked by test_imports
+_IMPORT_MODULES = (
+    "services.expense_service",
+    "services.export_service",
+    "services.database_service",
+    "models.expense_model",
+    "models.category_model",
+    "utils.validation",
+    "utils.date_utils",
+    "utils.formatters",
+)
+
+
+# Export method and file name for each format in test_complete_workflow
+EXPORTS = {
+    "csv": ("export_to_csv", "test_integration.csv"),
+    "xlsx": ("export_to_excel", "test_integration.xlsx"),
+}
+
+
+@pytest.fixture(scope="module")
+def workflow_expenses(expense_service_fixture):
+    """Add the workflow expense once and return the history containing it"""
+    logger.debug("🔧 Testing complete workflow...")
+
+    # Add test expense
+    result = expense_service_fixture.create_expense(
+        "2024-12-01", 
+        "Makanan & Minuman", 
+        "50000", 
+        "Test integration meal"
+    )
+    
+    assert result["success"] == True, f"Failed to add expense: {result.get('error', 'Unknown error')}"
+    assert result.get("expense_id") is not None, "Expense ID not returned"
+    logger.debug("✅ Expense added successfully (ID: %s)", result['expense_id'])
+    
+    # Get history
+    expenses = expense_service_fixture.get_expense_history()
+    assert len(expenses) > 0, "No expenses found in history"
+    logger.debug("✅ Found %s expenses in history", len(expenses))
+    
+    # Find our test expense
+    assert any(
+        expense.get("description") == "Test integration meal" for expense in expenses
+    ), "Test expense not found in history"
+    logger.debug("✅ Test expense found in history")
+    return expenses
+
 
 class TestIntegration:
     """End-to-end integration tests"""
 
-    def test_complete_workflow(self, expense_service_fixture, export_service_fixture, clean_exports_dir):
+    @pytest.mark.parametrize("export_format", sorted(EXPORTS))
+    def test_complete_workflow(self, export_format, workflow_expenses, export_service_fixture, clean_exports_dir):
         """Test complete workflow: add expense -> get history -> export"""
         try:
-            print("\n🔧 Testing complete workflow...")
-            
-            # Add test expense
-            result = expense_service_fixture.create_expense(
-                "2024-12-01", 
-                "Makanan & Minuman", 
-                "50000", 
-                "Test integration meal"
-            )
-            
-            assert result["success"] == True, f"Failed to add expense: {result.get('error', 'Unknown error')}"
-            print("✅ Expense added successfully")
+            method, filename = EXPORTS[export_format]
+            filepath = getattr(export_service_fixture, method)(workflow_expenses, filename)
+            assert filename in filepath
             
-            # Get expense ID
-            expense_id = result.get("expense_id")
-            assert expense_id is not None, "Expense ID not returned"
-            print(f"✅ Expense ID: {expense_id}")
+            # One stat call: raises FileNotFoundError if the file was not created
+            size = os.stat(filepath).st_size
+            assert size > 0, f"{export_format} file is empty"
+            logger.debug("✅ %s exported: %s (%s bytes)", export_format, filepath, size)
             
-            # Get history
-            expenses = expense_service_fixture.get_expense_history()
-            assert len(expenses) > 0, "No expenses found in history"
-            print(f"✅ Found {len(expenses)} expenses in history")
-            
-            # Find our test expense
-            test_expense = None
-            for expense in expenses:
-                if expense.get('description') == "Test integration meal":
-                    test_expense = expense
-                    break
-            
-            assert test_expense is not None, "Test expense not found in history"
-            print("✅ Test expense found in history")
-            
-            # Export to CSV
-            csv_filepath = export_service_fixture.export_to_csv(expenses, "test_integration.csv")
-            assert os.path.exists(csv_filepath), f"CSV file not created: {csv_filepath}"
-            assert "test_integration.csv" in csv_filepath
-            print(f"✅ CSV exported: {csv_filepath}")
-            
-            # Export to Excel
-            excel_filepath = export_service_fixture.export_to_excel(expenses, "test_integration.xlsx")
-            assert os.path.exists(excel_filepath), f"Excel file not created: {excel_filepath}"
-            assert "test_integration.xlsx" in excel_filepath
-            print(f"✅ Excel exported: {excel_filepath}")
-            
-            # Verify file sizes
-            csv_size = os.path.getsize(csv_filepath)
-            excel_size = os.path.getsize(excel_filepath)
-            assert csv_size > 0, "CSV file is empty"
-            assert excel_size > 0, "Excel file is empty"
-            
-            print(f"\n📊 Test results:")
-            print(f"  CSV file: {csv_filepath} ({csv_size} bytes)")
-            print(f"  Excel file: {excel_filepath} ({excel_size} bytes)")
-            
-            # Clean up test files
-            try:
-                if os.path.exists(csv_filepath):
-                    os.remove(csv_filepath)
-                if os.path.exists(excel_filepath):
-                    os.remove(excel_filepath)
-                print("✅ Test files cleaned up")
-            except Exception as e:
-                print(f"⚠️  Warning: Could not clean up test files: {e}")
-            
-            print("\n🎉 Complete workflow test passed!")
+            logger.debug("🎉 Complete workflow test passed for %s!", export_format)
             
         except AssertionError as e:
-            print(f"❌ Assertion error: {e}")
+            logger.error("❌ Assertion error: %s", e)
             raise
         except Exception as e:
-            print(f"❌ Unexpected error: {e}")
+            logger.error("❌ Unexpected error: %s", e)
             raise
 
     def test_monthly_report_export(self, expense_service_fixture, export_service_fixture, clean_exports_dir):
         """Test monthly report export functionality"""
         try:
-            print("\n📅 Testing monthly report export...")
+            logger.debug("📅 Testing monthly report export...")
             
             # Add a test expense first
             result = expense_service_fixture.create_expense(
@@ -105,11 +106,10 @@ class TestIntegration:
             )
             
             if not result["success"]:
-                print(f"⚠️  Could not add test expense: {result.get('error')}")
+                logger.warning("⚠️  Could not add test expense: %s", result.get('error'))
                 # Skip this test if we can't add an expense
                 # Don't use return in pytest test method
                 # Instead, use pytest.skip() or just pass
-                import pytest
                 pytest.skip(f"Could not add test expense: {result.get('error')}")
             
             # Get current month data
@@ -119,74 +119,54 @@ class TestIntegration:
             # Get monthly analysis
             analysis = expense_service_fixture.get_monthly_analysis(year, month)
             assert analysis is not None, "Monthly analysis failed"
-            print(f"✅ Monthly analysis retrieved")
+            logger.debug("✅ Monthly analysis retrieved")
             
             # Get expenses for the month
             expenses = expense_service_fixture.get_expense_history({'year': year, 'month': month})
-            print(f"✅ Found {len(expenses)} expenses for {month}/{year}")
+            logger.debug("✅ Found %s expenses for %s/%s", len(expenses), month, year)
             
             # Export monthly report (only if there are expenses)
             if expenses:
                 report_path = export_service_fixture.export_monthly_report(analysis, expenses)
-                assert os.path.exists(report_path), f"Monthly report not created: {report_path}"
                 assert "monthly_report" in report_path
                 
-                # Verify file
-                report_size = os.path.getsize(report_path)
+                # One stat call: raises FileNotFoundError if the report was not created
+                report_size = os.stat(report_path).st_size
                 assert report_size > 0, "Monthly report file is empty"
                 
-                print(f"✅ Monthly report created: {report_path} ({report_size} bytes)")
-                
-                # Clean up
-                try:
-                    if os.path.exists(report_path):
-                        os.remove(report_path)
-                        print("✅ Monthly report cleaned up")
-                except Exception as e:
-                    print(f"⚠️  Could not clean up report: {e}")
+                logger.debug("✅ Monthly report created: %s (%s bytes)", report_path, report_size)
             else:
-                print("⚠️  No expenses found for monthly report test")
+                logger.warning("⚠️  No expenses found for monthly report test")
             
-            print("\n✅ Monthly report test completed!")
+            logger.debug("✅ Monthly report test completed!")
             
         except AssertionError as e:
-            print(f"❌ Assertion error: {e}")
+            logger.error("❌ Assertion error: %s", e)
             raise
         except Exception as e:
-            print(f"❌ Unexpected error: {e}")
+            logger.error("❌ Unexpected error: %s", e)
             raise
 
 
-def test_imports():
+def test_imports(expense_service_fixture, export_service_fixture, db_service):
     """Test that all necessary imports work"""
-    print("Testing imports...")
+    logger.debug("Testing imports...")
     
-    # Test service imports
+    # Test service, model and utility imports
+    for module_name in _IMPORT_MODULES:
+        importlib.import_module(module_name)
     from services.expense_service import ExpenseService
     from services.export_service import ExportService
     from services.database_service import DatabaseService
     
-    # Test model imports
-    from models.expense_model import Expense
-    from models.category_model import Category
-    
-    # Test utility imports
-    from utils.validation import validate_amount, validate_date
-    from utils.date_utils import get_current_month_year
-    from utils.formatters import format_currency
-    
-    print("✅ All imports successful!")
-    
-    # Create instances
-    expense_service = ExpenseService()
-    export_service = ExportService()
-    database_service = DatabaseService()
+    logger.debug("✅ All imports successful!")
     
-    assert expense_service is not None, "ExpenseService should not be None"
-    assert export_service is not None, "ExportService should not be None"
-    assert database_service is not None, "DatabaseService should not be None"
+    # Instances come from the session fixtures in conftest.py
+    assert isinstance(expense_service_fixture, ExpenseService)
+    assert isinstance(export_service_fixture, ExportService)
+    assert isinstance(db_service, DatabaseService)
     
-    print("✅ Service instances created successfully!")
+    logger.debug("✅ Service instances created successfully!")
     # Tidak perlu return apapun - fungsi test harus mengembalikan None
 
 
@@ -198,31 +178,15 @@ if __name__ == "__main__":
     # Test imports first
     try:
         # Test imports
-        from services.expense_service import ExpenseService
-        from services.export_service import ExportService
-        from services.database_service import DatabaseService
-        from models.expense_model import Expense
-        from models.category_model import Category
-        from utils.validation import validate_amount, validate_date
-        from utils.date_utils import get_current_month_year
-        from utils.formatters import format_currency
+        for module_name in _IMPORT_MODULES:
+            importlib.import_module(module_name)
         
         print("✅ All imports successful!")
         
-        # Create instances
-        expense_service = ExpenseService()
-        export_service = ExportService()
-        database_service = DatabaseService()
-        
-        print("✅ Service instances created successfully!")
-        
         print("\n" + "=" * 60)
         print("Running integration tests with pytest...")
         
         # Run pytest on this file
-        import pytest
-        import sys
-        
         # Run specific tests
         test_result = pytest.main([
             __file__,
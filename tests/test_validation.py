@@ -0,0 +1,120 @@
+# tests/test_validation.py
+
+"""
+Unit tests for the input validation utilities
+"""
+
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from utils.validation import (
+    make_category_validator,
+    make_expense_validator,
+    validate_amount,
+    validate_amount_batch,
+    validate_expense_data,
+    validate_expense_data_batch,
+)
+
+CATEGORIES = ["Belanja", "Hiburan"]
+
+
+def test_make_expense_validator_matches_validate_expense_data():
+    """The factory's validator gives the same results as validate_expense_data"""
+    validator = make_expense_validator(CATEGORIES)
+    rows = [
+        ("2024-01-15", "Belanja", "Rp 50000", " Lunch "),
+        ("2024-02-30", "Belanja", "1000", ""),
+        ("2024-01-15", "Transportasi", "1000", ""),
+        ("2024-01-15", "  ", "abc", ""),
+    ]
+    for row in rows:
+        assert validator(*row) == validate_expense_data(*row, allowed_categories=CATEGORIES)
+
+    assert validator(*rows[0]) == (
+        True,
+        {
+            "date": date(2024, 1, 15),
+            "category": "Belanja",
+            "amount": Decimal("50000"),
+            "description": "Lunch",
+        },
+        "",
+    )
+    assert validator(*rows[2])[2] == "Category 'Transportasi' is not in allowed categories"
+    assert validator(*rows[3])[2] == (
+        "Category cannot be empty; Invalid amount. Must be a positive number"
+    )
+
+
+def test_make_expense_validator_freezes_categories():
+    """Later changes to the caller's list do not affect a built validator"""
+    categories = list(CATEGORIES)
+    validator = make_expense_validator(categories)
+    categories.append("Transportasi")
+    assert not validator("2024-01-15", "Transportasi", "1000")[0]
+
+
+def test_validate_amount_batch_matches_validate_amount():
+    """Batch amount validation returns one validate_amount result per input"""
+    amounts = ["50000", "Rp 1000", "IDR 12,5", "$ 7.25", "1.000.000", "-5", "0", "abc", ""]
+    assert validate_amount_batch(amounts) == [validate_amount(amount) for amount in amounts]
+    assert validate_amount_batch(["Rp 1000", "5-"]) == [(True, Decimal("1000")), (False, None)]
+    assert validate_amount_batch([]) == []
+
+
+def test_validate_expense_data_fast_fail():
+    """fast_fail stops at the first error; the default collects them all"""
+    assert validate_expense_data("bad", "", "abc", fast_fail=True) == (
+        False,
+        {},
+        "Invalid date format. Use YYYY-MM-DD",
+    )
+    valid, data, message = validate_expense_data(
+        "2024-01-15", "Transportasi", "abc", allowed_categories=CATEGORIES, fast_fail=True
+    )
+    assert not valid
+    assert data == {"date": date(2024, 1, 15)}
+    assert message == "Category 'Transportasi' is not in allowed categories"
+    assert validate_expense_data("bad", "", "abc")[2] == (
+        "Invalid date format. Use YYYY-MM-DD; Category cannot be empty; "
+        "Invalid amount. Must be a positive number"
+    )
+
+
+def test_make_category_validator():
+    """The category validator strips input and checks the frozen set"""
+    validate = make_category_validator(CATEGORIES)
+    assert validate("Belanja")
+    assert validate(" Hiburan ")
+    assert not validate("Transportasi")
+    assert not validate("")
+    assert not validate(None)
+
+
+def test_validate_expense_data_batch_matches_rows():
+    """Batch validation gives validate_expense_data's result for every row"""
+    dates = ["2024-01-15", "bad", "2024-01-16"]
+    categories = ["Belanja", "Belanja", "Transportasi"]
+    amounts = ["Rp 1000", "2000", "-1"]
+    descriptions = [" a ", None, ""]
+
+    results = validate_expense_data_batch(dates, categories, amounts, descriptions, CATEGORIES)
+    assert results == [
+        validate_expense_data(*row, allowed_categories=CATEGORIES)
+        for row in zip(dates, categories, amounts, descriptions)
+    ]
+    assert [valid for valid, _, _ in results] == [True, False, False]
+    assert validate_expense_data_batch(dates, categories, amounts)[2][2] == (
+        "Invalid amount. Must be a positive number"
+    )
+
+
+def test_validate_expense_data_batch_rejects_ragged_columns():
+    """Columns of different lengths raise instead of silently dropping rows"""
+    with pytest.raises(ValueError):
+        validate_expense_data_batch(["2024-01-15"], ["Belanja", "Hiburan"], ["1000"])
+    with pytest.raises(ValueError):
+        validate_expense_data_batch(["2024-01-15"], ["Belanja"], ["1000"], ["a", "b"])
@@ -5,9 +5,49 @@ Date Utilities
 Provides utility functions for date manipulation and formatting.
 """
 
-import calendar
 from datetime import date, datetime, timedelta
 
+# Built once; the name lookups below are called per row when formatting reports
+_MONTH_NAMES_ID = (
+    "Januari",
+    "Februari",
+    "Maret",
+    "April",
+    "Mei",
+    "Juni",
+    "Juli",
+    "Agustus",
+    "September",
+    "Oktober",
+    "November",
+    "Desember",
+)
+_MONTH_NAMES_EN = (
+    "January",
+    "February",
+    "March",
+    "April",
+    "May",
+    "June",
+    "July",
+    "August",
+    "September",
+    "October",
+    "November",
+    "December",
+)
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+_WEEKDAY_NAMES_ID = ("Senin", "Selasa", "Rabu", "Kamis", "Jumat", "Sabtu", "Minggu")
+_WEEKDAY_NAMES_EN = (
+    "Monday",
+    "Tuesday",
+    "Wednesday",
+    "Thursday",
+    "Friday",
+    "Saturday",
+    "Sunday",
+)
+
 def get_current_date():
     return date.today()
 
@@ -16,45 +56,14 @@ def get_current_month_year():
     return now.month, now.year
 
 def get_month_name(month, language="id"):
-    if language == "id":
-        month_names = [
-            "Januari",
-            "Februari",
-            "Maret",
-            "April",
-            "Mei",
-            "Juni",
-            "Juli",
-            "Agustus",
-            "September",
-            "Oktober",
-            "November",
-            "Desember",
-        ]
-    else:
-        month_names = [
-            "January",
-            "February",
-            "March",
-            "April",
-            "May",
-            "June",
-            "July",
-            "August",
-            "September",
-            "October",
-            "November",
-            "December",
-        ]
-
+    month_names = _MONTH_NAMES_ID if language == "id" else _MONTH_NAMES_EN
     if 1 <= month <= 12:
         return month_names[month - 1]
     return ""
 
 def get_month_range(year, month):
     start_date = date(year, month, 1)
-    _, last_day = calendar.monthrange(year, month)
-    end_date = date(year, month, last_day)
+    end_date = date(year, month, get_days_in_month(year, month))
     return start_date, end_date
 
 def get_previous_month(year, month):
@@ -79,27 +88,18 @@ def parse_date_string(date_str, format_str="%Y-%m-%d"):
         return None
 
 def get_days_in_month(year, month):
-    return calendar.monthrange(year, month)[1]
+    if not 1 <= month <= 12:
+        raise ValueError(f"bad month number {month}; must be 1-12")
+    if month == 2 and is_leap_year(year):
+        return 29
+    return _DAYS_IN_MONTH[month - 1]
 
 def is_leap_year(year):
-    return calendar.isleap(year)
+    return year & 3 == 0 and (year % 100 != 0 or year % 400 == 0)
 
 def get_weekday_name(date_obj, language="id"):
-    if language == "id":
-        weekday_names = ["Senin", "Selasa", "Rabu", "Kamis", "Jumat", "Sabtu", "Minggu"]
-    else:
-        weekday_names = [
-            "Monday",
-            "Tuesday",
-            "Wednesday",
-            "Thursday",
-            "Friday",
-            "Saturday",
-            "Sunday",
-        ]
-
-    weekday_index = date_obj.weekday()
-    return weekday_names[weekday_index]
+    weekday_names = _WEEKDAY_NAMES_ID if language == "id" else _WEEKDAY_NAMES_EN
+    return weekday_names[date_obj.weekday()]
 
 def get_last_n_months(n=6, include_current=True):
     months = []
@@ -112,22 +112,23 @@ def get_last_n_months(n=6, include_current=True):
     year, month = current_year, current_month
     for _ in range(n):
         year, month = get_previous_month(year, month)
-        months.insert(0, (year, month))
+        months.append((year, month))
 
+    # Collected newest first; one reverse instead of inserting at the front
+    months.reverse()
     return months
 
 def get_date_range(start_date, end_date):
     if start_date > end_date:
         return []
 
-    date_list = []
-    current_date = start_date
-
-    while current_date <= end_date:
-        date_list.append(current_date)
-        current_date += timedelta(days=1)
+    if type(start_date) is date and type(end_date) is date:
+        # Build the days from their ordinals in one C-level map
+        return list(map(date.fromordinal, range(start_date.toordinal(), end_date.toordinal() + 1)))
 
-    return date_list
+    # datetimes keep their time of day
+    days = (end_date - start_date).days
+    return [start_date + timedelta(days=offset) for offset in range(days + 1)]
 
 def get_monthly_dates(year, month):
     start_date, end_date = get_month_range(year, month)
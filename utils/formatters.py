@@ -7,11 +7,24 @@ Provides functions to format numbers and strings for display purposes.
 
 from datetime import datetime
 from decimal import Decimal
+from functools import lru_cache
 from typing import Optional
 
+
 def format_currency(amount: Decimal) -> str:
+    if amount == 0:
+        # -0.0 and 0 share a cache entry, so both format as "Rp 0"
+        amount += 0
+    return _format_currency(type(amount), amount)
+
+
+# Listings repeat the same amounts a lot; keyed on the type as well, so a
+# cached string never comes from an equal value of another type
+@lru_cache(maxsize=4096)
+def _format_currency(amount_type: type, amount: Decimal) -> str:
     return f"Rp {amount:,.0f}".replace(",", ".")
 
+
 def format_date(
     date_string: str, input_format: str = "%Y-%m-%d", output_format: str = "%d/%m/%Y"
 ) -> str:
@@ -21,28 +34,36 @@ def format_date(
     except ValueError:
         return date_string
 
+
+_CATEGORY_ICONS = {
+    "Makanan & Minuman": "🍔",
+    "Transportasi": "🚗",
+    "Belanja": "🛍️",
+    "Hiburan": "🎬",
+    "Kesehatan": "🏥",
+    "Pendidikan": "📚",
+    "Tagihan": "📋",
+    "Lain-lain": "📦",
+    "Food": "🍔",
+    "Transport": "🚗",
+    "Shopping": "🛍️",
+    "Entertainment": "🎬",
+    "Healthcare": "🏥",
+    "Education": "📚",
+    "Bills": "📋",
+    "Others": "📦",
+}
+_DEFAULT_ICON = "📦"
+# Final "icon name" labels, so known categories cost one dict lookup
+_CATEGORY_LABELS = {name: f"{icon} {name}" for name, icon in _CATEGORY_ICONS.items()}
+
+
 def format_category(category: str) -> str:
-    icons = {
-        "Makanan & Minuman": "🍔",
-        "Transportasi": "🚗",
-        "Belanja": "🛍️",
-        "Hiburan": "🎬",
-        "Kesehatan": "🏥",
-        "Pendidikan": "📚",
-        "Tagihan": "📋",
-        "Lain-lain": "📦",
-        "Food": "🍔",
-        "Transport": "🚗",
-        "Shopping": "🛍️",
-        "Entertainment": "🎬",
-        "Healthcare": "🏥",
-        "Education": "📚",
-        "Bills": "📋",
-        "Others": "📦",
-    }
-
-    icon = icons.get(category, "📦")
-    return f"{icon} {category}"
+    label = _CATEGORY_LABELS.get(category)
+    if label is None:
+        return f"{_DEFAULT_ICON} {category}"
+    return label
+
 
 def format_percentage(value: float) -> str:
     return f"{value:.1f}%"
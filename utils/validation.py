@@ -7,32 +7,78 @@ Provides functions to validate expense data inputs
 import re
 from datetime import date, datetime
 from decimal import Decimal, InvalidOperation
-from typing import List, Optional, Tuple, Union
+from functools import lru_cache, partial
+from typing import Callable, Collection, List, Optional, Tuple, Union
+
+# Everything except digits, dots, commas and the minus sign, e.g. "Rp " prefixes
+_AMOUNT_CLEAN_RE = re.compile(r"[^\d.,\-]")
+_strip_amount_noise = partial(_AMOUNT_CLEAN_RE.sub, "")
+_AMOUNT_CHARS = "0123456789.,-"
+# Currency markers stripped without the regex when they lead the amount
+_CURRENCY_PREFIXES = ("Rp", "IDR", "$")
+# Decimals are immutable, so one shared zero serves every comparison and default
+_DEC_ZERO = Decimal("0")
+
+
+def _clean_amount(amount_string: str) -> str:
+    """Reduce an amount string to digits, dots, commas and minus signs"""
+    if amount_string.isascii():
+        if not amount_string.strip(_AMOUNT_CHARS):
+            # "50000" or "1000.50": nothing to strip
+            return amount_string
+        if amount_string.startswith(_CURRENCY_PREFIXES):
+            for prefix in _CURRENCY_PREFIXES:
+                if amount_string.startswith(prefix):
+                    cleaned = amount_string[len(prefix):].lstrip()
+                    if not cleaned.strip(_AMOUNT_CHARS):
+                        # "Rp 100.000": only the currency marker had to go
+                        return cleaned
+                    break
+    return _strip_amount_noise(amount_string)
 
 
 def validate_date(date_string: str, date_format: str = "%Y-%m-%d") -> Tuple[bool, Optional[date]]:
     """Validate date format and return (is_valid, date_object)"""
     try:
-        parsed_date = datetime.strptime(date_string, date_format).date()
-        return True, parsed_date
+        if date_format == "%Y-%m-%d" and len(date_string) == 10 and (
+            date_string[4] == date_string[7] == "-"
+        ):
+            # date.fromisoformat is a C fast path for the canonical YYYY-MM-DD form
+            return True, date.fromisoformat(date_string)
     except ValueError:
         return False, None
+    parsed_date = _strptime_date(date_string, date_format)
+    return parsed_date is not None, parsed_date
+
+
+@lru_cache(maxsize=2048)
+def _strptime_date(date_string: str, date_format: str) -> Optional[date]:
+    """strptime fallback for validate_date, memoised since each call costs microseconds"""
+    try:
+        return datetime.strptime(date_string, date_format).date()
+    except ValueError:
+        return None
 
 
 def validate_amount(amount_string: str) -> Tuple[bool, Optional[Decimal]]:
     """Validate amount format and return (is_valid, decimal_amount)"""
+    return _validate_cleaned_amount(_clean_amount(amount_string))
+
+
+def validate_amount_batch(amount_strings: List[str]) -> List[Tuple[bool, Optional[Decimal]]]:
+    """validate_amount for many strings, cleaning them all in one pass"""
+    return list(map(_validate_cleaned_amount, map(_clean_amount, amount_strings)))
+
+
+def _validate_cleaned_amount(cleaned: str) -> Tuple[bool, Optional[Decimal]]:
+    """Validate an amount already reduced to digits, dots, commas and minus signs"""
     try:
-        # Keep digits, dots, commas, and minus sign
-        cleaned = re.sub(r"[^\d.,\-]", "", amount_string)
         if not cleaned:
             return False, None
 
-        # Check for multiple decimal points or minus signs
-        if cleaned.count(".") > 1 or cleaned.count(",") > 1 or cleaned.count("-") > 1:
-            return False, None
-        
-        # Minus sign must be at the beginning if present
-        if "-" in cleaned and not cleaned.startswith("-"):
+        # Reject multiple decimal points, and any minus sign past the first
+        # character (which also rules out a second minus sign)
+        if cleaned.count(".") > 1 or cleaned.count(",") > 1 or cleaned.find("-", 1) != -1:
             return False, None
 
         # Replace comma with dot for decimal
@@ -43,7 +89,7 @@ def validate_amount(amount_string: str) -> Tuple[bool, Optional[Decimal]]:
 
         # Validate amount is positive (greater than 0)
         # Negative amounts should return False
-        if amount <= Decimal("0"):
+        if amount <= _DEC_ZERO:
             return False, amount
 
         return True, amount
@@ -61,30 +107,41 @@ def parse_amount(amount_string: str) -> Decimal:
     """Parse string amount to Decimal (returns 0 if invalid)"""
     try:
         # Remove non-digit characters except dot, comma, and minus
-        cleaned = re.sub(r"[^\d.,\-]", "", amount_string)
+        cleaned = _clean_amount(amount_string)
         if not cleaned:
-            return Decimal("0")
+            return _DEC_ZERO
             
         # Minus sign must be at the beginning if present
-        if "-" in cleaned and not cleaned.startswith("-"):
-            return Decimal("0")
+        if cleaned.find("-", 1) != -1:
+            return _DEC_ZERO
             
         # Replace comma with dot for decimal
         cleaned = cleaned.replace(",", ".")
         return Decimal(cleaned)
     except (InvalidOperation, ValueError):
-        return Decimal("0")
+        return _DEC_ZERO
 
 
 def validate_category(
-    category: str, allowed_categories: Optional[List[str]] = None
+    category: str, allowed_categories: Optional[Collection[str]] = None
 ) -> bool:
     """Validate category"""
-    if not category or not category.strip():
+    stripped = category.strip() if category else ""
+    if not stripped:
         return False
     if allowed_categories is None:
         return True
-    return category.strip() in allowed_categories
+    return stripped in allowed_categories
+
+
+def make_category_validator(allowed_categories: Collection[str]) -> Callable[[str], bool]:
+    """Build a validate_category for a fixed set, converted to a frozenset once"""
+    allowed = frozenset(allowed_categories)
+
+    def _validate(category: str) -> bool:
+        return bool(category) and category.strip() in allowed
+
+    return _validate
 
 
 def validate_expense_data(
@@ -92,9 +149,28 @@ def validate_expense_data(
     category: str,
     amount_str: str,
     description: str = "",
-    allowed_categories: Optional[List[str]] = None,
+    allowed_categories: Optional[Collection[str]] = None,
+    fast_fail: bool = False,
 ) -> Tuple[bool, dict, str]:
-    """Validate all expense data at once"""
+    """Validate all expense data at once
+
+    Pass allowed_categories as a set or frozenset for constant-time lookups.
+    With fast_fail, stop at the first error instead of collecting them all.
+    """
+    return _validate_expense_row(
+        date_str, category, amount_str, description, allowed_categories, fast_fail
+    )
+
+
+def _validate_expense_row(
+    date_str: str,
+    category: str,
+    amount_str: str,
+    description: str,
+    allowed_categories: Optional[Collection[str]],
+    fast_fail: bool,
+) -> Tuple[bool, dict, str]:
+    """Row validation shared by validate_expense_data and its batch and factory forms"""
     errors = []
     validated_data = {}
 
@@ -102,16 +178,21 @@ def validate_expense_data(
     date_valid, date_value = validate_date(date_str)
     if not date_valid:
         errors.append("Invalid date format. Use YYYY-MM-DD")
+        if fast_fail:
+            return False, validated_data, errors[0]
     else:
         validated_data["date"] = date_value
 
     # Validate category
-    if not category or not category.strip():
+    stripped_category = category.strip() if category else ""
+    if not stripped_category:
         errors.append("Category cannot be empty")
     elif allowed_categories and category not in allowed_categories:
         errors.append(f"Category '{category}' is not in allowed categories")
     else:
-        validated_data["category"] = category.strip()
+        validated_data["category"] = stripped_category
+    if errors and fast_fail:
+        return False, validated_data, errors[0]
 
     # Validate amount
     amount_valid, amount_value = validate_amount(amount_str)
@@ -133,14 +214,53 @@ def validate_expense_data(
         return True, validated_data, ""
 
 
+def make_expense_validator(
+    allowed_categories: Collection[str],
+) -> Callable[..., Tuple[bool, dict, str]]:
+    """Build validate_expense_data for a fixed category set known at startup
+
+    The categories are frozen once, so a loop calling
+    validator(date_str, category, amount_str, description) neither copies
+    them nor scans a list for each row.
+    """
+    allowed = frozenset(allowed_categories)
+
+    def validator(
+        date_str: str, category: str, amount_str: str, description: str = ""
+    ) -> Tuple[bool, dict, str]:
+        return _validate_expense_row(date_str, category, amount_str, description, allowed, False)
+
+    return validator
+
+
+def validate_expense_data_batch(
+    dates: List[str],
+    categories: List[str],
+    amounts: List[str],
+    descriptions: Optional[List[str]] = None,
+    allowed_categories: Optional[Collection[str]] = None,
+) -> List[Tuple[bool, dict, str]]:
+    """validate_expense_data for equal-length columns, e.g. a CSV import"""
+    if not len(dates) == len(categories) == len(amounts) or (
+        descriptions is not None and len(descriptions) != len(dates)
+    ):
+        raise ValueError("All columns must have the same number of rows")
+    if descriptions is None:
+        descriptions = [""] * len(dates)
+    # Frozen once for the whole batch
+    allowed = frozenset(allowed_categories) if allowed_categories else None
+    return [
+        _validate_expense_row(date_str, category, amount_str, description, allowed, False)
+        for date_str, category, amount_str, description in zip(
+            dates, categories, amounts, descriptions
+        )
+    ]
+
+
 # Backward compatibility functions for existing code
 def validate_date_simple(date_string: str, format: str = "%Y-%m-%d") -> bool:
     """Simple date validation (for backward compatibility)"""
-    try:
-        datetime.strptime(date_string, format)
-        return True
-    except ValueError:
-        return False
+    return validate_date(date_string, format)[0]
 
 
 def test_validation_logic():